@@ -3,7 +3,7 @@ Application layer - Use cases and business logic orchestration
 """
 import os
 import asyncio
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
 from ..domain import (
     DevelopmentContext, 
@@ -25,8 +25,13 @@ from ..infrastructure.display import DisplayService
 class AnalyzeXKitProjectUseCase:
     """Use case para analisar projetos .xkit com inteligência avançada"""
     
-    def __init__(self, display_service: IDisplayService):
+    def __init__(self, display_service: IDisplayService,
+                 inventory_scanner: Optional[Callable[[Path], Dict[str, Any]]] = None):
         self.display = display_service
+        # Optional walker returning {'total', 'code', 'config', 'doc', ...} counts
+        self.inventory_scanner = inventory_scanner
+        # Counts from the last structure analysis, reusable by the caller
+        self.last_inventory: Optional[Dict[str, Any]] = None
 
     async def execute(self, path: str = None) -> None:
         """Analisa um projeto .xkit com análise inteligente usando IA"""
@@ -63,17 +68,27 @@ class AnalyzeXKitProjectUseCase:
 
     async def _analyze_structure(self, project_path: Path) -> None:
         """Análise básica da estrutura do projeto"""
-        files = list(project_path.rglob("*"))
-        files = [f for f in files if f.is_file() and not self._should_ignore_file(f)]
-        
-        code_files = [f for f in files if f.suffix in ['.py', '.js', '.ts', '.ps1', '.java', '.go', '.rs', '.cpp', '.c']]
-        config_files = [f for f in files if f.suffix in ['.json', '.yaml', '.yml', '.toml', '.ini']]
-        doc_files = [f for f in files if f.suffix in ['.md', '.rst', '.txt'] or 'README' in f.name.upper()]
-        
-        print(f"📁 Total de arquivos: {len(files)}")
-        print(f"💻 Código fonte: {len(code_files)}")
-        print(f"⚙️  Configuração: {len(config_files)}")
-        print(f"📚 Documentação: {len(doc_files)}")
+        if self.inventory_scanner is not None:
+            inventory = self.inventory_scanner(project_path)
+        else:
+            files = list(project_path.rglob("*"))
+            files = [f for f in files if f.is_file() and not self._should_ignore_file(f)]
+            
+            code_files = [f for f in files if f.suffix in ['.py', '.js', '.ts', '.ps1', '.java', '.go', '.rs', '.cpp', '.c']]
+            config_files = [f for f in files if f.suffix in ['.json', '.yaml', '.yml', '.toml', '.ini']]
+            doc_files = [f for f in files if f.suffix in ['.md', '.rst', '.txt'] or 'README' in f.name.upper()]
+            inventory = {
+                'total': len(files),
+                'code': len(code_files),
+                'config': len(config_files),
+                'doc': len(doc_files)
+            }
+        self.last_inventory = inventory
+        
+        print(f"📁 Total de arquivos: {inventory['total']}")
+        print(f"💻 Código fonte: {inventory['code']}")
+        print(f"⚙️  Configuração: {inventory['config']}")
+        print(f"📚 Documentação: {inventory['doc']}")
 
     def _should_ignore_file(self, file_path: Path) -> bool:
         """Ignora arquivos comuns que não são relevantes para análise"""
@@ -129,7 +144,7 @@ class AnalyzeXKitProjectUseCase:
             
         except Exception as e:
             print(f"❌ Erro na análise com IA: {e}")
-            print("� Fallback para análise básica...")
+            print("🔄 Fallback para análise básica...")
             await self._basic_scoring(project_path)
 
     async def _analyze_git_repo(self, project_path: Path) -> dict:
@@ -370,7 +385,7 @@ class AnalyzeXKitProjectUseCase:
         ]
         
         # Detecta tipo de projeto
-        has_python = any((project_path / f).exists() for f in ['*.py']) or list(project_path.rglob("*.py"))
+        has_python = next(project_path.rglob("*.py"), None) is not None
         has_node = (project_path / 'package.json').exists()
         has_docker = (project_path / 'Dockerfile').exists() 
         has_git = (project_path / '.git').exists()
@@ -696,7 +711,7 @@ class AnalyzeXKitProjectUseCase:
             open_prs = github_info.get('open_prs', [])
             open_prs_count = github_info.get('open_prs_count', 0)
             if open_prs_count > 0:
-                context_parts.append(f"� Pull Requests abertos: {open_prs_count}")
+                context_parts.append(f"🔀 Pull Requests abertos: {open_prs_count}")
                 for pr in open_prs[:2]:
                     context_parts.append(
                         f"- #{pr['number']}: {pr['title']} ({pr['author']['login']})"
@@ -704,7 +719,7 @@ class AnalyzeXKitProjectUseCase:
         
         context_parts.extend([
             "",
-            "## �📚 Análise de Documentação",
+            "## 📚 Análise de Documentação",
         ])
         
         # Documentação com qualidade
@@ -882,7 +897,7 @@ Responda de forma concisa mas detalhada, focando em aspectos práticos para dese
     async def _display_smart_analysis(self, ai_response: str, git_info: dict, docs: dict, code_structure: dict) -> None:
         """Exibe a análise completa formatada"""
         
-        print(f"\n� ANÁLISE INTELIGENTE COMPLETA")
+        print(f"\n🧠 ANÁLISE INTELIGENTE COMPLETA")
         print("=" * 60)
         
         # Info Git resumida
@@ -914,7 +929,7 @@ Responda de forma concisa mas detalhada, focando em aspectos práticos para dese
                                          code_structure: dict, issues: dict, missing_files: dict):
         """Display avançado com todas as informações"""
         
-        print(f"\n� ANÁLISE INTELIGENTE COMPLETA")
+        print(f"\n🧠 ANÁLISE INTELIGENTE COMPLETA")
         print("=" * 60)
         
         # Informações Git
@@ -1071,7 +1086,7 @@ Responda de forma concisa mas detalhada, focando em aspectos práticos para dese
                     section_count += 1
                     continue
                 elif line.startswith('**') and line.endswith('**') and 'RECOMENDAÇÕES' in line:
-                    print(f"\n� PRÓXIMOS PASSOS")
+                    print(f"\n🚀 PRÓXIMOS PASSOS")
                     print("-" * 30)
                     section_count += 1
                     continue
@@ -2,7 +2,7 @@
 Domain interfaces - Contracts for data access and external services
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Iterable
 from pathlib import Path
 from .entities import (
     GitInfo, ReadmeInfo, ProjectInfo, ContainerInfo, DevelopmentContext,
@@ -23,6 +23,11 @@ class IFileSystemRepository(ABC):
         """Read file content"""
         pass
     
+    @abstractmethod
+    def read_file_head(self, file_path: Path, size: int = 4096) -> Optional[str]:
+        """Read the beginning of a file"""
+        pass
+    
     @abstractmethod
     def file_exists(self, file_path: Path) -> bool:
         """Check if file exists"""
@@ -32,6 +37,16 @@ class IFileSystemRepository(ABC):
     def glob_files(self, path: Path, pattern: str) -> List[Path]:
         """Find files matching pattern"""
         pass
+    
+    @abstractmethod
+    def list_file_names(self, path: Path, include_dirs: bool = False) -> Set[str]:
+        """Names of the files (and optionally dirs) directly inside path"""
+        pass
+    
+    @abstractmethod
+    def scan_extensions(self, root: Path, wanted: Iterable[str], max_files: int = 20000) -> Set[str]:
+        """Return which of the wanted file extensions occur under root"""
+        pass
 
 
 class IGitRepository(ABC):
@@ -142,8 +157,9 @@ class IErrorHandler(ABC):
         """Get the most recent error"""
         pass
     
+    @property
     @abstractmethod
-    def get_error_count(self) -> int:
+    def error_count(self) -> int:
         """Get total error count"""
         pass
 
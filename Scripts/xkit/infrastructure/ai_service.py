@@ -246,8 +246,7 @@ IMPORTANTE: Complete toda a resposta sem cortar no meio.
 
     async def _async_call_gemini(self, prompt: str) -> Optional[str]:
         """Async version of Gemini API call"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._call_gemini, prompt)
+        return await asyncio.to_thread(self._call_gemini, prompt)
 
     def _call_gemini(self, prompt: str) -> Optional[str]:
         """Chama a API do Gemini"""
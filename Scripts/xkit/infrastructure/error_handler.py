@@ -2,7 +2,8 @@
 Infrastructure - Error Handler Implementation
 """
 import re
-from typing import Optional, List, Dict
+from collections import deque
+from typing import Optional, Deque, Dict
 from datetime import datetime
 from pathlib import Path
 
@@ -16,7 +17,8 @@ class ErrorHandler(IErrorHandler):
     """Implementation of error handling operations"""
     
     def __init__(self):
-        self.errors: List[XKitError] = []
+        # Keep only last 50 errors to prevent memory issues
+        self.errors: Deque[XKitError] = deque(maxlen=50)
         self.error_counter = 0
         
     def create_error(self, message: str, command: str = "", context: str = "") -> XKitError:
@@ -101,17 +103,14 @@ class ErrorHandler(IErrorHandler):
     def store_error(self, error: XKitError) -> None:
         """Store error for tracking"""
         self.errors.append(error)
-        
-        # Keep only last 50 errors to prevent memory issues
-        if len(self.errors) > 50:
-            self.errors = self.errors[-50:]
     
     def get_last_error(self) -> Optional[XKitError]:
         """Get the most recent error"""
         return self.errors[-1] if self.errors else None
     
-    def get_error_count(self) -> int:
-        """Get total error count"""
+    @property
+    def error_count(self) -> int:
+        """Total errors ever created (retained errors: ``len(self.errors)``)"""
         return self.error_counter
     
     def _detect_error_type(self, message: str) -> ErrorType:
@@ -0,0 +1,19 @@
+"""
+Event loop selection for the XKit entry points
+"""
+import asyncio
+import importlib
+import sys
+
+
+def install_fast_event_loop() -> bool:
+    """Run asyncio on uvloop (winloop on Windows) when installed - xkit[fast]"""
+    module_name = "winloop" if sys.platform == "win32" else "uvloop"
+    try:
+        loop_module = importlib.import_module(module_name)
+    except ImportError:
+        return False
+    
+    # libuv loop: cheaper subprocess spawns, pipe reads and HTTP I/O for the MCP servers
+    asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+    return True
@@ -2,34 +2,101 @@
 File system repository implementation
 """
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Set, Iterable
 from ..domain.interfaces import IFileSystemRepository
 
 
+# Directories never worth descending into when scanning a project
+SCAN_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+
+@lru_cache(maxsize=128)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Decoded file content; mtime/size in the key make edits a cache miss"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+
 class FileSystemRepository(IFileSystemRepository):
     """File system operations implementation"""
     
     def find_git_root(self, start_path: Path) -> Optional[Path]:
         """Find the root of a git repository"""
-        current = Path(start_path).resolve()
-        while current.parent != current:
-            if (current / '.git').exists():
-                return current
-            current = current.parent
+        # Plain string walk - no Path objects or symlink resolution per level
+        current = os.path.abspath(start_path)
+        parent = os.path.dirname(current)
+        while parent != current:
+            if os.path.exists(os.path.join(current, '.git')):
+                return Path(current)
+            current, parent = parent, os.path.dirname(parent)
         return None
     
     def read_file(self, file_path: Path) -> Optional[str]:
         """Read file content"""
+        path = os.fspath(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return _read_text_cached(path, stat.st_mtime_ns, stat.st_size)
+    
+    def read_file_head(self, file_path: Path, size: int = 4096) -> Optional[str]:
+        """Read at most the first size characters of a file"""
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read(size)
         except Exception:
             return None
     
     def file_exists(self, file_path: Path) -> bool:
         """Check if file exists"""
-        return file_path.exists()
+        return os.path.exists(file_path)
+    
+    def list_file_names(self, path: Path, include_dirs: bool = False) -> Set[str]:
+        """Names of the regular files (and optionally dirs) directly inside path (one scandir)"""
+        try:
+            with os.scandir(path) as entries:
+                if include_dirs:
+                    return {entry.name for entry in entries}
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+    
+    def scan_extensions(self, root: Path, wanted: Iterable[str], max_files: int = 20000) -> Set[str]:
+        """Walk the tree once and return which of the wanted extensions occur"""
+        remaining = {ext.lower() for ext in wanted}
+        found: Set[str] = set()
+        stack = [os.fspath(root)]
+        seen_files = 0
+        
+        while stack and remaining and seen_files < max_files:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in SCAN_SKIP_DIRS:
+                                    stack.append(entry.path)
+                                continue
+                        except OSError:
+                            continue
+                        
+                        seen_files += 1
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in remaining:
+                            remaining.discard(ext)
+                            found.add(ext)
+                            if not remaining:
+                                break
+            except OSError:
+                continue
+        
+        return found
     
     def glob_files(self, path: Path, pattern: str) -> List[Path]:
         """Find files matching pattern"""
@@ -3,7 +3,7 @@ Git repository implementation
 """
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from ..domain.interfaces import IGitRepository
 from ..domain.entities import GitInfo
 
@@ -14,8 +14,12 @@ class GitRepository(IGitRepository):
     def get_git_info(self, git_root: Path) -> Optional[GitInfo]:
         """Get Git repository information"""
         try:
-            branch = self.get_current_branch(git_root)
-            changes_count = self.get_changes_count(git_root)
+            status = self._read_status(git_root)
+            if status is not None:
+                branch, changes_count = status
+            else:
+                branch = self.get_current_branch(git_root)
+                changes_count = self.get_changes_count(git_root)
             is_clean = changes_count == 0
             
             return GitInfo(
@@ -29,10 +33,16 @@ class GitRepository(IGitRepository):
     
     def get_current_branch(self, git_root: Path) -> str:
         """Get current branch name"""
+        # Hot path: read HEAD straight from disk instead of spawning git
+        branch = self.read_head_branch(git_root)
+        if branch is not None:
+            return branch
+        
         try:
             result = subprocess.run(
                 ['git', 'branch', '--show-current'],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 cwd=git_root
             )
@@ -45,7 +55,8 @@ class GitRepository(IGitRepository):
         try:
             result = subprocess.run(
                 ['git', 'status', '--porcelain'],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 cwd=git_root
             )
@@ -53,4 +64,57 @@ class GitRepository(IGitRepository):
                 return len(result.stdout.strip().split('\n'))
             return 0
         except Exception:
-            return 0
\ No newline at end of file
+            return 0
+    
+    def _read_status(self, git_root: Path) -> Optional[Tuple[str, int]]:
+        """Get (branch, changes count) from a single porcelain v2 status call"""
+        try:
+            result = subprocess.run(
+                ['git', 'status', '--porcelain=v2', '--branch', '-z'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=git_root
+            )
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        
+        branch = ''
+        changes_count = 0
+        records = iter(result.stdout.split(b'\x00'))
+        for record in records:
+            if not record:
+                continue
+            if record.startswith(b'# branch.head '):
+                head = record[len(b'# branch.head '):].decode('utf-8', 'replace')
+                # Detached HEAD - same result as `git branch --show-current`
+                branch = '' if head == '(detached)' else head
+            elif not record.startswith(b'#'):
+                changes_count += 1
+                if record.startswith(b'2 '):
+                    # Renames/copies carry the original path as an extra record
+                    next(records, None)
+        
+        return branch, changes_count
+    
+    def read_head_branch(self, git_root: Path) -> Optional[str]:
+        """Read the current branch from .git/HEAD, None if it can't be resolved"""
+        try:
+            git_dir = Path(git_root) / '.git'
+            if git_dir.is_file():
+                # Worktrees and submodules point at the real git dir
+                pointer = git_dir.read_text(encoding='utf-8').strip()
+                if not pointer.startswith('gitdir:'):
+                    return None
+                git_dir = (Path(git_root) / pointer[len('gitdir:'):].strip()).resolve()
+            
+            head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        
+        if head.startswith('ref: refs/heads/'):
+            return head[len('ref: refs/heads/'):]
+        
+        # Detached HEAD - same result as `git branch --show-current`
+        return ''
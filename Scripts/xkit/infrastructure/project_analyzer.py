@@ -2,12 +2,21 @@
 Project analyzer implementation
 """
 import re
+import json
 from pathlib import Path
 from typing import List, Optional
 from ..domain.interfaces import IProjectAnalyzer, IFileSystemRepository
 from ..domain.entities import ReadmeInfo, ProjectInfo
 
 
+# Only the title, first paragraph and a 200 char preview are used
+README_SCAN_LIMIT = 4096
+
+_TITLE_RE = re.compile(r'^#\s*(.+)', re.MULTILINE)
+# First non-blank line that isn't a heading, image or badge
+_DESCRIPTION_RE = re.compile(r'^[ \t]*+(?![#!]|\[!\[)(\S.*)$', re.MULTILINE)
+
+
 class ProjectAnalyzer(IProjectAnalyzer):
     """Project analysis implementation"""
     
@@ -24,68 +33,86 @@ class ProjectAnalyzer(IProjectAnalyzer):
             'Java': ['pom.xml', 'build.gradle', '*.java', 'gradle.properties'],
             'Web': ['index.html', 'webpack.config.js', 'vite.config.js'],
             'TypeScript': ['tsconfig.json', '*.ts', '*.tsx'],
-            'React': ['package.json'],  # Will be refined by package.json content
             'Git': ['.git', '.gitignore'],
         }
+        # React has no marker file of its own - it is read from package.json below
+        
+        # Split once into (tech -> root file names) and (tech -> extensions)
+        self._specific_files = {
+            tech: frozenset(p.lower() for p in patterns if not p.startswith('*.'))
+            for tech, patterns in self.tech_indicators.items()
+        }
+        self._extensions = {
+            tech: frozenset(p[1:] for p in patterns if p.startswith('*.'))
+            for tech, patterns in self.tech_indicators.items()
+        }
+        self._all_extensions = frozenset().union(*self._extensions.values())
     
     def detect_technologies(self, project_path: Path) -> List[str]:
         """Detect technologies used in project"""
-        detected = []
+        # One listing of the root for specific files, one walk for extensions
+        present_files = {
+            name.lower()
+            for name in self.file_system.list_file_names(project_path, include_dirs=True)
+        }
+        present_extensions = self.file_system.scan_extensions(project_path, self._all_extensions)
         
-        for tech, patterns in self.tech_indicators.items():
-            for pattern in patterns:
-                if pattern.startswith('*.'):
-                    # File extension pattern
-                    ext = pattern[1:]
-                    files = self.file_system.glob_files(project_path, f'**/*{ext}')
-                    if files[:3]:  # Limit search to first 3 matches
-                        detected.append(tech)
-                        break
-                else:
-                    # Specific file pattern
-                    if self.file_system.file_exists(project_path / pattern):
-                        detected.append(tech)
-                        break
+        detected = [
+            tech for tech in self.tech_indicators
+            if self._specific_files[tech] & present_files
+            or self._extensions[tech] & present_extensions
+        ]
         
         # Special detection for React (check package.json content)
-        if 'Node.js' in detected:
-            package_json_path = project_path / 'package.json'
-            if self.file_system.file_exists(package_json_path):
-                content = self.file_system.read_file(package_json_path)
-                if content and ('react' in content.lower() or 'next' in content.lower()):
-                    if 'React' not in detected:
-                        detected.append('React')
+        if 'Node.js' in detected and 'package.json' in present_files:
+            content = self.file_system.read_file(project_path / 'package.json')
+            if content and self._uses_react(content):
+                detected.append('React')
         
         return detected
     
+    def _uses_react(self, package_json: str) -> bool:
+        """Check package.json dependencies for React/Next.js"""
+        try:
+            package = json.loads(package_json)
+            dependencies = dict(package.get('dependencies') or {})
+            dependencies.update(package.get('devDependencies') or {})
+        except (ValueError, AttributeError, TypeError):
+            return False
+        
+        return 'react' in dependencies or 'next' in dependencies or '@types/react' in dependencies
+    
     def analyze_readme(self, project_path: Path) -> Optional[ReadmeInfo]:
         """Analyze README files"""
         readme_files = ['README.md', 'readme.md', 'README.txt', 'README', 'Readme.md']
         
+        # List the directory once instead of probing each candidate name;
+        # match case-insensitively like the Windows filesystem does
+        names_on_disk = {}
+        for name in sorted(self.file_system.list_file_names(project_path)):
+            names_on_disk.setdefault(name.lower(), name)
+        
         for readme_file in readme_files:
-            readme_path = project_path / readme_file
-            if self.file_system.file_exists(readme_path):
-                content = self.file_system.read_file(readme_path)
-                if content:
-                    return self._parse_readme_content(readme_file, content)
+            actual_name = names_on_disk.get(readme_file.lower())
+            if actual_name is None:
+                continue
+            content = self.file_system.read_file_head(project_path / actual_name, README_SCAN_LIMIT)
+            if content:
+                return self._parse_readme_content(actual_name, content)
         
         return None
     
     def _parse_readme_content(self, filename: str, content: str) -> ReadmeInfo:
         """Parse README content to extract information"""
+        head = content[:README_SCAN_LIMIT]
+        
         # Extract title (first line with #)
-        title_match = re.search(r'^#\s*(.+)', content, re.MULTILINE)
+        title_match = _TITLE_RE.search(head)
         title = title_match.group(1).strip() if title_match else None
         
         # Extract first description (first paragraph after title)
-        lines = content.split('\n')
-        description = None
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.startswith('#') and not stripped.startswith('!') and not stripped.startswith('[!['):
-                description = stripped
-                break
+        description_match = _DESCRIPTION_RE.search(head)
+        description = description_match.group(1).strip() if description_match else None
         
         # Create content preview
         content_preview = content[:200] + '...' if len(content) > 200 else content
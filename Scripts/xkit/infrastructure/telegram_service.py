@@ -3,9 +3,16 @@ Telegram Service - Notificações de anomalias via Telegram
 """
 import os
 import json
+import asyncio
+import time
+import queue
+import atexit
+import threading
 import requests
+import requests.adapters
 from typing import Optional, Dict, Any, TYPE_CHECKING
 from datetime import datetime
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from ..domain.entities import DevelopmentContext
@@ -14,11 +21,43 @@ if TYPE_CHECKING:
 class TelegramService:
     """Serviço de notificações via Telegram"""
     
+    # Ícones do resumo (somente leitura, compartilhado entre instâncias)
+    TECH_ICONS = MappingProxyType({
+        'Python': '🐍', 'Node.js': '📦', 'Docker': '🐳',
+        'React': '⚛️', 'TypeScript': '📘', 'Java': '☕'
+    })
+    
     def __init__(self, token: Optional[str] = None, admin_id: Optional[str] = None):
         self.token = token or os.getenv('TELEGRAM_TOKEN')
         self.admin_id = admin_id or os.getenv('ADMIN_ID')
         self.base_url = f"https://api.telegram.org/bot{self.token}" if self.token else None
         
+        # Keep-alive session so consecutive calls reuse the TLS connection
+        self._session = requests.Session()
+        self._session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=4))
+        
+        # Fila de envio em background (worker iniciado no primeiro envio)
+        self._outbox: 'queue.SimpleQueue[str]' = queue.SimpleQueue()
+        self._pending = 0
+        self._pending_done = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        
+        # Sessão aiohttp para envios a partir do event loop (criada no primeiro uso)
+        self._async_session = None
+        
+        # Segundos pedidos pelo último 429 do Telegram (None se não houve)
+        self.retry_after: Optional[float] = None
+    
+    def close(self) -> None:
+        """Fecha as conexões HTTP mantidas pela sessão"""
+        self._session.close()
+    
+    async def aclose(self) -> None:
+        """Fecha a sessão aiohttp, se já foi aberta"""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        
     def is_available(self) -> bool:
         """Verifica se o serviço está disponível"""
         return bool(self.token and self.admin_id)
@@ -29,7 +68,7 @@ class TelegramService:
             return None
             
         try:
-            response = requests.get(f"{self.base_url}/getMe", timeout=10)
+            response = self._session.get(f"{self.base_url}/getMe", timeout=10)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -42,7 +81,7 @@ class TelegramService:
             return False
             
         message = self._format_anomaly_message(anomalies, project_name)
-        return self._send_message(message)
+        return self._enqueue_message(message)
     
     def send_project_summary(self, context: 'DevelopmentContext') -> bool:
         """Envia resumo do projeto"""
@@ -50,57 +89,109 @@ class TelegramService:
             return False
             
         message = self._format_project_summary(context)
-        return self._send_message(message)
+        return self._enqueue_message(message)
     
     def _format_anomaly_message(self, anomalies: Dict[str, Any], project_name: str) -> str:
         """Formata mensagem de anomalias"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         
-        message = f"🚨 *XKit Alert* - {timestamp}\n"
-        message += f"📁 Projeto: `{project_name}`\n\n"
+        parts = [
+            f"🚨 *XKit Alert* - {timestamp}\n",
+            f"📁 Projeto: `{project_name}`\n\n"
+        ]
         
         for key, description in anomalies.items():
             if 'many_changes' in key:
-                message += f"📝 {description}\n"
+                parts.append(f"📝 {description}\n")
             elif 'config' in key:
-                message += f"⚠️ {description}\n"
+                parts.append(f"⚠️ {description}\n")
             else:
-                message += f"❓ {description}\n"
+                parts.append(f"❓ {description}\n")
         
-        return message
+        return "".join(parts)
     
     def _format_project_summary(self, context: 'DevelopmentContext') -> str:
         """Formata resumo do projeto"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         
-        message = f"📊 *XKit Status* - {timestamp}\n"
-        message += f"📁 `{context.project.name}`\n"
+        parts = [
+            f"📊 *XKit Status* - {timestamp}\n",
+            f"📁 `{context.project.name}`\n"
+        ]
         
         if context.project.technologies:
-            tech_icons = {
-                'Python': '🐍', 'Node.js': '📦', 'Docker': '🐳',
-                'React': '⚛️', 'TypeScript': '📘', 'Java': '☕'
-            }
-            
-            tech_line = ""
-            for tech in context.project.technologies[:3]:  # Max 3 tecnologias
-                icon = tech_icons.get(tech, '🛠️')
-                tech_line += f"{icon}{tech} "
-            
-            if tech_line:
-                message += f"🛠️ {tech_line.strip()}\n"
+            tech_line = " ".join(
+                f"{self.TECH_ICONS.get(tech, '🛠️')}{tech}"
+                for tech in context.project.technologies[:3]  # Max 3 tecnologias
+            )
+            parts.append(f"🛠️ {tech_line}\n")
         
         if context.is_git_project:
             status = "🟢" if context.git.is_clean else "🟡"
-            message += f"🌿 {status} `{context.git.current_branch}`"
-            if not context.git.is_clean:
-                message += f" ({context.git.changes_count} changes)"
-            message += "\n"
+            if context.git.is_clean:
+                parts.append(f"🌿 {status} `{context.git.current_branch}`\n")
+            else:
+                parts.append(
+                    f"🌿 {status} `{context.git.current_branch}` "
+                    f"({context.git.changes_count} changes)\n"
+                )
         
         if context.has_containers:
-            message += f"🐳 {context.container.engine_type.title()}\n"
+            parts.append(f"🐳 {context.container.engine_type.title()}\n")
         
-        return message
+        return "".join(parts)
+    
+    def _enqueue_message(self, message: str) -> bool:
+        """Agenda a mensagem para envio sem bloquear o chamador"""
+        if not self.base_url:
+            return False
+        
+        with self._pending_done:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain_outbox, name="xkit-telegram-outbox", daemon=True
+                )
+                self._worker.start()
+                # Processos curtos (prompt/CLI) ainda entregam o que ficou na fila
+                atexit.register(self.flush)
+            self._pending += 1
+        
+        self._outbox.put(message)
+        return True
+    
+    def _drain_outbox(self) -> None:
+        """Worker: envia as mensagens da fila, uma por vez"""
+        while True:
+            message = self._outbox.get()
+            try:
+                self._send_message(message)
+            finally:
+                with self._pending_done:
+                    self._pending -= 1
+                    self._pending_done.notify_all()
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Aguarda o envio das mensagens pendentes (True se a fila esvaziou)"""
+        deadline = time.monotonic() + timeout
+        with self._pending_done:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._pending_done.wait(remaining)
+        return True
+    
+    @staticmethod
+    def _parse_retry_after(response) -> Optional[float]:
+        """Espera pedida num 429: header Retry-After ou parameters.retry_after do corpo"""
+        try:
+            return float(response.headers['Retry-After'])
+        except (KeyError, TypeError, ValueError):
+            pass
+        try:
+            return float(response.json()['parameters']['retry_after'])
+        except Exception:
+            return None
     
     def _send_message(self, message: str) -> bool:
         """Envia mensagem via Telegram"""
@@ -114,7 +205,7 @@ class TelegramService:
                 'parse_mode': 'Markdown'
             }
             
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/sendMessage",
                 data=data,
                 timeout=5
@@ -125,19 +216,55 @@ class TelegramService:
         except Exception:
             return False
     
+    async def _send_message_async(self, message: str) -> bool:
+        """Envia mensagem via Telegram sem sair do event loop
+        
+        Usa uma sessão aiohttp keep-alive, então envios concorrentes dividem
+        as conexões com api.telegram.org em vez de ocupar uma thread cada.
+        """
+        if not self.base_url:
+            return False
+        
+        try:
+            import aiohttp
+        except ImportError:
+            # Sem aiohttp: mesmo envio, pela sessão requests em uma thread
+            return await asyncio.to_thread(self._send_message, message)
+        
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
+        
+        data = {
+            'chat_id': self.admin_id,
+            'text': message,
+            'parse_mode': 'Markdown'
+        }
+        
+        try:
+            async with self._async_session.post(f"{self.base_url}/sendMessage", data=data) as response:
+                return response.status == 200
+        except Exception:
+            return False
+    
     def get_bot_info(self) -> Optional[Dict[str, Any]]:
         """Obtém informações do bot"""
         try:
             if not self.base_url:
                 return None
                 
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/getMe",
                 timeout=5
             )
             
             if response.status_code == 200:
+                self.retry_after = None
                 return response.json().get('result', {})
+            if response.status_code == 429:
+                self.retry_after = self._parse_retry_after(response)
             return None
             
         except Exception:
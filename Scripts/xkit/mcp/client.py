@@ -13,6 +13,11 @@ from pathlib import Path
 from .protocol import MCPClient, MCPProtocol, MCPMessage, Tool, MCPError
 
 
+# StreamReader buffer for stdio servers (asyncio's default is 64 KiB, which
+# large tool results overflow and which forces many small reads)
+STDIO_READ_LIMIT = 16 * 1024 * 1024
+
+
 class MCPConnectionPool:
     """Manages connections to multiple MCP servers with pooling"""
     
@@ -61,7 +66,8 @@ class MCPConnectionPool:
             command, *args,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            limit=STDIO_READ_LIMIT
         )
         
         return {
@@ -108,30 +114,38 @@ class MCPConnectionPool:
     
     async def close_connection(self, server_name: str):
         """Close a specific connection"""
-        if server_name in self.connections:
-            conn = self.connections[server_name]
-            
-            if conn["type"] == "stdio" and "process" in conn:
-                process = conn["process"]
-                if process.returncode is None:
-                    process.terminate()
-                    try:
-                        await asyncio.wait_for(process.wait(), timeout=5.0)
-                    except asyncio.TimeoutError:
-                        process.kill()
-            
-            del self.connections[server_name]
-            self.active_connections = max(0, self.active_connections - 1)
+        # Detach before awaiting so concurrent closes never see it twice
+        conn = self.connections.pop(server_name, None)
+        if conn is None:
+            return
+        self.active_connections = max(0, self.active_connections - 1)
+        
+        if conn["type"] == "stdio" and "process" in conn:
+            process = conn["process"]
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    process.kill()
     
     async def close_all(self):
         """Close all connections"""
-        for server_name in list(self.connections.keys()):
-            await self.close_connection(server_name)
+        # In parallel: shutdown waits for the slowest server, not the sum
+        await asyncio.gather(
+            *(self.close_connection(server_name) for server_name in list(self.connections)),
+            return_exceptions=True
+        )
 
 
 class XKitMCPClient(MCPClient):
     """Enhanced MCP Client for XKit with connection pooling and configuration management"""
     
+    # Seconds a tool -> server mapping stays valid
+    TOOL_INDEX_TTL = 300.0
+    # Seconds a server's tool list / liveness is reused without asking it again
+    TOOLS_CACHE_TTL = 60.0
+    
     def __init__(self, config_path: Optional[Path] = None):
         super().__init__()
         self.config_path = config_path or Path(__file__).parent / "config.json"
@@ -140,6 +154,16 @@ class XKitMCPClient(MCPClient):
         self.logger = logging.getLogger(__name__)
         self._config_loaded = False
         
+        # tool name -> (server name, Tool), rebuilt lazily by find_tool
+        self._tool_index: Dict[str, tuple[str, Tool]] = {}
+        self._tool_index_expires = 0.0
+        self._tool_index_generation = 0
+        
+        # Per-server tool lists and liveness, so background listing/health
+        # work does not reach (or spawn) servers on every call
+        self._tools_cache: Dict[str, tuple[float, List[Tool]]] = {}
+        self._health_cache: Dict[str, tuple[float, bool]] = {}
+        
         # Don't load config in __init__ to avoid async issues
         # Will be loaded on first use
     
@@ -159,6 +183,9 @@ class XKitMCPClient(MCPClient):
             self.servers_config = {}
         finally:
             self._config_loaded = True
+            self._invalidate_tool_index()
+            self._tools_cache.clear()
+            self._health_cache.clear()
     
     async def _ensure_config_loaded(self):
         """Ensure configuration is loaded before operations"""
@@ -211,30 +238,79 @@ class XKitMCPClient(MCPClient):
         await self._ensure_config_loaded()
         return self.servers_config.copy()
 
+    async def list_tools(self, server_name: str) -> List[Tool]:
+        """List tools from a server, reusing a recent answer"""
+        now = asyncio.get_event_loop().time()
+        cached = self._tools_cache.get(server_name)
+        if cached and now < cached[0]:
+            return cached[1]
+        
+        try:
+            tools = await super().list_tools(server_name)
+        except Exception:
+            self._tools_cache.pop(server_name, None)
+            self._health_cache[server_name] = (now + self.TOOLS_CACHE_TTL, False)
+            raise
+        
+        self._tools_cache[server_name] = (now + self.TOOLS_CACHE_TTL, tools)
+        self._health_cache[server_name] = (now + self.TOOLS_CACHE_TTL, True)
+        return tools
+    
     async def list_all_tools(self) -> Dict[str, List[Tool]]:
         """List tools from all configured servers"""
         all_tools = {}
         
-        for server_name in self.servers_config.keys():
-            try:
-                tools = await self.list_tools(server_name)
-                all_tools[server_name] = tools
-            except Exception as e:
-                self.logger.error(f"Failed to list tools from {server_name}: {e}")
+        # Probe every server concurrently - wall time is the slowest server
+        server_names = list(self.servers_config)
+        results = await asyncio.gather(
+            *(self.list_tools(server_name) for server_name in server_names),
+            return_exceptions=True
+        )
+        
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to list tools from {server_name}: {result}")
                 all_tools[server_name] = []
+                self._invalidate_tool_index()
+            else:
+                all_tools[server_name] = result
         
         return all_tools
     
     async def find_tool(self, tool_name: str) -> Optional[tuple[str, Tool]]:
         """Find a tool by name across all servers"""
+        now = asyncio.get_event_loop().time()
+        if self._tool_index and now < self._tool_index_expires:
+            if tool_name in self._tool_index:
+                return self._tool_index[tool_name]
+        
+        # Index missing, stale or without this tool - rebuild it once
+        await self._rebuild_tool_index()
+        return self._tool_index.get(tool_name)
+    
+    async def _rebuild_tool_index(self):
+        """Re-list every server and rebuild the tool -> server map"""
+        generation = self._tool_index_generation
         all_tools = await self.list_all_tools()
         
+        index: Dict[str, tuple[str, Tool]] = {}
         for server_name, tools in all_tools.items():
             for tool in tools:
-                if tool.name == tool_name:
-                    return (server_name, tool)
+                # First server wins, as with the previous linear search
+                index.setdefault(tool.name, (server_name, tool))
         
-        return None
+        self._tool_index = index
+        # Only trust the index if no server failed while it was being built
+        if generation == self._tool_index_generation:
+            self._tool_index_expires = asyncio.get_event_loop().time() + self.TOOL_INDEX_TTL
+        else:
+            self._tool_index_expires = 0.0
+    
+    def _invalidate_tool_index(self):
+        """Forget the cached tool -> server map"""
+        self._tool_index = {}
+        self._tool_index_expires = 0.0
+        self._tool_index_generation += 1
     
     async def call_tool_by_name(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call a tool by name, automatically finding the correct server"""
@@ -245,17 +321,35 @@ class XKitMCPClient(MCPClient):
         server_name, tool = result
         return await self.call_tool(server_name, tool_name, arguments)
     
-    async def health_check(self) -> Dict[str, bool]:
-        """Check health of all configured servers"""
+    async def health_check(self, force: bool = False) -> Dict[str, bool]:
+        """Check health of all configured servers (cached liveness unless force)"""
         health_status = {}
         
-        for server_name in self.servers_config.keys():
-            try:
-                await self.list_tools(server_name)
-                health_status[server_name] = True
-            except Exception as e:
-                self.logger.error(f"Health check failed for {server_name}: {e}")
+        if force:
+            for server_name in self.servers_config:
+                self._tools_cache.pop(server_name, None)
+            server_names = list(self.servers_config)
+        else:
+            now = asyncio.get_event_loop().time()
+            server_names = []
+            for server_name in self.servers_config:
+                cached = self._health_cache.get(server_name)
+                if cached and now < cached[0]:
+                    health_status[server_name] = cached[1]
+                else:
+                    server_names.append(server_name)
+        
+        results = await asyncio.gather(
+            *(self.list_tools(server_name) for server_name in server_names),
+            return_exceptions=True
+        )
+        
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Health check failed for {server_name}: {result}")
                 health_status[server_name] = False
+            else:
+                health_status[server_name] = True
         
         return health_status
     
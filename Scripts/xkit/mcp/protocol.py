@@ -4,12 +4,65 @@ Basic implementation of MCP (Model Context Protocol) for XKit integration
 """
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Union, Callable, Awaitable, Tuple
+from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+try:
+    # Optional accelerator for large tool results (formatted reports) - xkit[fast]
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Shared encoder/decoder - json.dumps/loads build a new one per call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_JSON_DECODER = json.JSONDecoder()
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _encode_json(payload: Any) -> str:
+    """Encode with orjson when installed, falling back to the stdlib encoder"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # orjson.JSONEncodeError: e.g. integers beyond 64 bits, which json accepts
+            pass
+    return _JSON_ENCODER.encode(payload)
+
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def bind_tool_arguments(handler: Callable[..., Awaitable[Any]], *params: Tuple[str, Any]) -> ToolHandler:
+    """Adapt handler(a, b, ...) to a call_tool style handler(arguments).
+    
+    params are (argument name, default) pairs in positional order. The usual
+    arities get a closure with the lookups spelled out, so a tool call costs
+    one .get per argument and nothing else.
+    """
+    if not params:
+        return lambda arguments: handler()
+    if len(params) == 1:
+        (key, default), = params
+        return lambda arguments: handler(arguments.get(key, default))
+    if len(params) == 2:
+        (key1, default1), (key2, default2) = params
+        return lambda arguments: handler(
+            arguments.get(key1, default1), arguments.get(key2, default2)
+        )
+    if len(params) == 3:
+        (key1, default1), (key2, default2), (key3, default3) = params
+        return lambda arguments: handler(
+            arguments.get(key1, default1), arguments.get(key2, default2), arguments.get(key3, default3)
+        )
+    return lambda arguments: handler(*[arguments.get(key, default) for key, default in params])
+
+
+@dataclass(slots=True)
 class MCPMessage:
     """Base MCP message structure"""
     id: Optional[str] = None
@@ -19,20 +72,32 @@ class MCPMessage:
     error: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """MCP Tool definition"""
     name: str
     description: str
     input_schema: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view for the wire (no deep copy like asdict)"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPError:
     """MCP Error structure"""
     code: int
     message: str
     data: Optional[Any] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view for the wire (no deep copy like asdict)"""
+        return {"code": self.code, "message": self.message, "data": self.data}
 
 
 class MCPProtocol:
@@ -60,16 +125,28 @@ class MCPProtocol:
         return MCPMessage(
             id=request_id,
             result=result,
-            error=asdict(error) if error else None
+            error=error.to_dict() if error else None
         )
     
     def serialize_message(self, message: MCPMessage) -> str:
-        """Serialize MCP message to JSON"""
-        return json.dumps(asdict(message), ensure_ascii=False)
+        """Serialize MCP message to JSON, omitting unset request-only fields"""
+        payload = {}
+        if message.id is not None:
+            payload["id"] = message.id
+        if message.method is not None:
+            payload["method"] = message.method
+        if message.params is not None:
+            payload["params"] = message.params
+        if message.error is not None:
+            payload["error"] = message.error
+        elif message.result is not None or message.method is None:
+            # JSON-RPC responses need result or error, even for a tool that returned None
+            payload["result"] = message.result
+        return _encode_json(payload)
     
     def parse_message(self, data: str) -> MCPMessage:
         """Parse JSON string to MCP message"""
-        parsed = json.loads(data)
+        parsed = _JSON_DECODER.decode(data)
         return MCPMessage(**parsed)
 
 
@@ -91,6 +168,17 @@ class MCPServer(ABC):
         """Execute a tool with given arguments"""
         pass
     
+    async def call_tools_batch(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """Run several {"name", "arguments"} tool calls concurrently.
+        
+        Results come back in call order; a failing call yields its exception
+        instead of cancelling the rest of the batch.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(call["name"], call.get("arguments") or {}) for call in calls),
+            return_exceptions=True
+        )
+    
     async def handle_request(self, message: MCPMessage) -> MCPMessage:
         """Handle incoming MCP request"""
         try:
@@ -98,7 +186,7 @@ class MCPServer(ABC):
                 tools = await self.list_tools()
                 return self.protocol.create_response(
                     message.id,
-                    {"tools": [asdict(tool) for tool in tools]}
+                    {"tools": [tool.to_dict() for tool in tools]}
                 )
             elif message.method == "tools/call":
                 name = message.params.get("name")
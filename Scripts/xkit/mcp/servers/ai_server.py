@@ -6,7 +6,112 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from ..protocol import MCPServer, Tool
+from ..protocol import MCPServer, Tool, bind_tool_arguments
+
+
+# Static tool schemas - built once at import instead of on every list_tools call
+_TOOLS = (
+    Tool(
+        name="analyze-error",
+        description="Analyze an error message and provide suggestions",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "error_message": {
+                    "type": "string",
+                    "description": "The error message to analyze"
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Additional context about the error"
+                }
+            },
+            "required": ["error_message"]
+        }
+    ),
+    Tool(
+        name="suggest-solution",
+        description="Get AI suggestions for a problem or task",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "problem": {
+                    "type": "string",
+                    "description": "Description of the problem or task"
+                },
+                "domain": {
+                    "type": "string",
+                    "description": "Domain context (git, docker, powershell, etc.)",
+                    "enum": ["git", "docker", "powershell", "python", "general"]
+                }
+            },
+            "required": ["problem"]
+        }
+    ),
+    Tool(
+        name="explain-code",
+        description="Explain code functionality and suggest improvements",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "code": {
+                    "type": "string",
+                    "description": "Code to analyze"
+                },
+                "language": {
+                    "type": "string",
+                    "description": "Programming language",
+                    "enum": ["python", "powershell", "bash", "javascript", "other"]
+                }
+            },
+            "required": ["code"]
+        }
+    ),
+)
+
+# Characters of submitted code echoed back by explain-code
+CODE_PREVIEW_LIMIT = 200
+
+# Tuples so the shared constants can't be changed through a response
+_DOMAIN_SUGGESTIONS = {
+    "git": (
+        "Check git status and current branch",
+        "Review recent commits",
+        "Consider using git stash if needed"
+    ),
+    "docker": (
+        "Check container status",
+        "Verify Docker daemon is running",
+        "Review Dockerfile and docker-compose configuration"
+    ),
+    "powershell": (
+        "Check PowerShell execution policy",
+        "Verify module imports",
+        "Test with elevated privileges if needed"
+    )
+}
+
+_GENERIC_SUGGESTIONS = (
+    "Break the problem into smaller parts",
+    "Research relevant documentation",
+    "Test with simple examples first"
+)
+
+
+def _domain_resources(domain: str) -> Dict[str, str]:
+    """Resource hints for a domain"""
+    return {
+        "documentation": f"Check {domain} official documentation",
+        "community": f"Search {domain} community forums",
+        "examples": f"Look for {domain} examples and tutorials"
+    }
+
+
+# Resource hints for the domains in the suggest-solution schema, formatted once
+_DOMAIN_RESOURCES = {
+    domain: _domain_resources(domain)
+    for domain in ("git", "docker", "powershell", "python", "general")
+}
 
 
 class XKitAIServer(MCPServer):
@@ -14,87 +119,47 @@ class XKitAIServer(MCPServer):
     
     def __init__(self):
         super().__init__("xkit-ai", "1.0.0")
-    
-    async def list_tools(self) -> List[Tool]:
-        """List available AI tools"""
-        return [
-            Tool(
-                name="analyze-error",
-                description="Analyze an error message and provide suggestions",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "error_message": {
-                            "type": "string",
-                            "description": "The error message to analyze"
-                        },
-                        "context": {
-                            "type": "string",
-                            "description": "Additional context about the error"
-                        }
-                    },
-                    "required": ["error_message"]
-                }
+        
+        # Tool name -> handler(arguments), resolved with a single dict lookup
+        self._dispatch = {
+            "analyze-error": bind_tool_arguments(
+                self._analyze_error, ("error_message", None), ("context", "")
             ),
-            Tool(
-                name="suggest-solution",
-                description="Get AI suggestions for a problem or task",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "problem": {
-                            "type": "string",
-                            "description": "Description of the problem or task"
-                        },
-                        "domain": {
-                            "type": "string",
-                            "description": "Domain context (git, docker, powershell, etc.)",
-                            "enum": ["git", "docker", "powershell", "python", "general"]
-                        }
-                    },
-                    "required": ["problem"]
-                }
+            "suggest-solution": bind_tool_arguments(
+                self._suggest_solution, ("problem", None), ("domain", "general")
             ),
-            Tool(
-                name="explain-code",
-                description="Explain code functionality and suggest improvements",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "code": {
-                            "type": "string",
-                            "description": "Code to analyze"
-                        },
-                        "language": {
-                            "type": "string",
-                            "description": "Programming language",
-                            "enum": ["python", "powershell", "bash", "javascript", "other"]
-                        }
-                    },
-                    "required": ["code"]
-                }
+            "explain-code": bind_tool_arguments(
+                self._explain_code, ("code", None), ("language", "other")
             )
-        ]
+        }
+    
+    async def list_tools(self) -> List[Tool]:
+        """List available AI tools"""
+        return list(_TOOLS)
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """Execute an AI tool with given arguments"""
-        if name == "analyze-error":
-            error_message = arguments.get("error_message")
-            context = arguments.get("context", "")
-            return await self._analyze_error(error_message, context)
-        elif name == "suggest-solution":
-            problem = arguments.get("problem")
-            domain = arguments.get("domain", "general")
-            return await self._suggest_solution(problem, domain)
-        elif name == "explain-code":
-            code = arguments.get("code")
-            language = arguments.get("language", "other")
-            return await self._explain_code(code, language)
-        else:
+        handler = self._dispatch.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
     
     async def _analyze_error(self, error_message: str, context: str) -> Dict[str, Any]:
         """Analyze error message and provide suggestions"""
+        return self._build_error_analysis(error_message, context)
+    
+    async def _suggest_solution(self, problem: str, domain: str) -> Dict[str, Any]:
+        """Suggest solutions for a problem"""
+        return self._build_solution(problem, domain)
+    
+    async def _explain_code(self, code: str, language: str) -> Dict[str, Any]:
+        """Explain code functionality"""
+        # Short snippets are returned as-is; only long ones are copied and cut
+        preview = code if len(code) <= CODE_PREVIEW_LIMIT else code[:CODE_PREVIEW_LIMIT] + "..."
+        return self._build_code_explanation(preview, language)
+    
+    def _build_error_analysis(self, error_message: str, context: str) -> Dict[str, Any]:
+        """Structured analysis for an error message"""
         # This would integrate with the existing XKit AI service
         # For now, return structured analysis
         return {
@@ -119,47 +184,28 @@ class XKitAIServer(MCPServer):
             "source": "xkit-ai-server"
         }
     
-    async def _suggest_solution(self, problem: str, domain: str) -> Dict[str, Any]:
-        """Suggest solutions for a problem"""
-        domain_suggestions = {
-            "git": [
-                "Check git status and current branch",
-                "Review recent commits",
-                "Consider using git stash if needed"
-            ],
-            "docker": [
-                "Check container status",
-                "Verify Docker daemon is running",
-                "Review Dockerfile and docker-compose configuration"
-            ],
-            "powershell": [
-                "Check PowerShell execution policy",
-                "Verify module imports",
-                "Test with elevated privileges if needed"
-            ]
-        }
+    def _build_solution(self, problem: str, domain: str) -> Dict[str, Any]:
+        """Suggestions and resources for a problem in a domain"""
+        resources = _DOMAIN_RESOURCES.get(domain)
+        if resources is None:
+            # Domains outside the schema enum still get their own hints
+            resources = _domain_resources(domain)
+        else:
+            resources = dict(resources)
         
         return {
             "problem": problem,
             "domain": domain,
-            "suggestions": domain_suggestions.get(domain, [
-                "Break the problem into smaller parts",
-                "Research relevant documentation",
-                "Test with simple examples first"
-            ]),
-            "resources": {
-                "documentation": f"Check {domain} official documentation",
-                "community": f"Search {domain} community forums",
-                "examples": f"Look for {domain} examples and tutorials"
-            },
+            "suggestions": list(_DOMAIN_SUGGESTIONS.get(domain, _GENERIC_SUGGESTIONS)),
+            "resources": resources,
             "ai_confidence": 0.8,
             "source": "xkit-ai-server"
         }
     
-    async def _explain_code(self, code: str, language: str) -> Dict[str, Any]:
-        """Explain code functionality"""
+    def _build_code_explanation(self, preview: str, language: str) -> Dict[str, Any]:
+        """Explanation for a code preview"""
         return {
-            "code": code[:200] + "..." if len(code) > 200 else code,
+            "code": preview,
             "language": language,
             "explanation": "This code performs various operations. Detailed analysis requires AI service integration.",
             "complexity": "Medium",
@@ -3,140 +3,303 @@ Git MCP Server
 Provides Git operations through MCP protocol
 """
 import asyncio
-from typing import Dict, Any, List, Optional
+import copy
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-import subprocess
 
-from ..protocol import MCPServer, Tool
+from ..protocol import MCPServer, Tool, bind_tool_arguments
+
+try:
+    import pygit2
+except ImportError:  # optional (xkit[git]) - fall back to the git binary
+    pygit2 = None
+
+
+# Static tool schemas - built once at import instead of on every list_tools call
+_TOOLS = (
+    Tool(
+        name="git-status",
+        description="Get current Git repository status",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Repository path (default: current directory)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="git-branch-info",
+        description="Get information about Git branches",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Repository path (default: current directory)"
+                },
+                "include_remote": {
+                    "type": "boolean",
+                    "description": "Include remote branches",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="git-commit-info",
+        description="Get recent commit information",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Repository path (default: current directory)"
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "Number of commits to show",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 100
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="git-create-branch",
+        description="Create a new Git branch with XKit naming conventions",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "branch_name": {
+                    "type": "string",
+                    "description": "Name for the new branch"
+                },
+                "branch_type": {
+                    "type": "string",
+                    "description": "Type of branch",
+                    "enum": ["feature", "fix", "refactor", "docs", "test"]
+                },
+                "from_branch": {
+                    "type": "string",
+                    "description": "Base branch (default: current branch)"
+                }
+            },
+            "required": ["branch_name", "branch_type"]
+        }
+    ),
+    Tool(
+        name="git-overview",
+        description="Get status, branches and recent commits in one call",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Repository path (default: current directory)"
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "Number of commits to show",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 100
+                }
+            },
+            "required": []
+        }
+    ),
+)
+
+
+if pygit2 is not None:
+    # libgit2 status bits -> porcelain X (index) and Y (worktree) letters
+    _INDEX_CODES = (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    )
+    _WORKTREE_CODES = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_RENAMED, "R"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    )
+
+
+def _porcelain_code(flags: int) -> str:
+    """Two letter `git status --porcelain` code for libgit2 status flags"""
+    if flags & pygit2.GIT_STATUS_CONFLICTED:
+        return "UU"
+    index = next((code for bit, code in _INDEX_CODES if flags & bit), " ")
+    worktree = next((code for bit, code in _WORKTREE_CODES if flags & bit), " ")
+    if index == " " and worktree == " " and flags & pygit2.GIT_STATUS_WT_NEW:
+        return "??"
+    return index + worktree
+
+
+def _commit_subject(message: str) -> str:
+    """First paragraph of a commit message on one line, like git's %s"""
+    return message.strip().split("\n\n", 1)[0].replace("\n", " ")
+
+
+@dataclass(frozen=True, slots=True)
+class StatusResult:
+    """git-status payload; immutable, so one instance can back the TTL cache"""
+    branch_info: str
+    modified_files: int
+    added_files: int
+    deleted_files: int
+    untracked_files: int
+    files: Tuple[str, ...]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Fresh dict for the wire - callers may mutate it freely"""
+        return {
+            "branch_info": self.branch_info,
+            "modified_files": self.modified_files,
+            "added_files": self.added_files,
+            "deleted_files": self.deleted_files,
+            "untracked_files": self.untracked_files,
+            "total_changes": len(self.files),
+            "clean": not self.files,
+            "files": list(self.files),
+            "source": "xkit-git-server"
+        }
+
+
+# Tools that only read the repository - identical calls in a batch can share one result
+_READ_ONLY_TOOLS = frozenset({"git-status", "git-branch-info", "git-commit-info", "git-overview"})
+
+# Tab separated, so branch listings parse without column guessing
+_BRANCH_REF_FORMAT = (
+    "--format=%(refname)%09%(HEAD)%09%(objectname:short)%09%(symref:short)%09%(contents:subject)"
+)
 
 
 class XKitGitServer(MCPServer):
     """Git operations MCP server"""
     
+    # Seconds a git-status result is reused for the same repository
+    STATUS_CACHE_TTL = 0.5
+    
     def __init__(self):
         super().__init__("xkit-git", "1.0.0")
-    
-    async def list_tools(self) -> List[Tool]:
-        """List available Git tools"""
-        return [
-            Tool(
-                name="git-status",
-                description="Get current Git repository status",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Repository path (default: current directory)"
-                        }
-                    },
-                    "required": []
-                }
+        
+        # Work tree root and libgit2 handle per absolute path, so repeat calls
+        # against the same repository skip discovery and opening
+        self._repo_root = lru_cache(maxsize=32)(self._find_repo_root)
+        self._repository = lru_cache(maxsize=32)(self._load_repository)
+        # Repo root -> lock; libgit2 objects must not be used from two threads at once
+        self._repository_locks: Dict[str, threading.Lock] = {}
+        
+        # Repo root -> (expires at, git-status result), absorbs dashboard refreshes
+        self._status_cache: Dict[str, Tuple[float, StatusResult]] = {}
+        
+        # Tool name -> handler(arguments), resolved with a single dict lookup
+        self._dispatch = {
+            "git-status": bind_tool_arguments(self._git_status, ("path", ".")),
+            "git-branch-info": bind_tool_arguments(
+                self._git_branch_info, ("path", "."), ("include_remote", True)
             ),
-            Tool(
-                name="git-branch-info",
-                description="Get information about Git branches",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Repository path (default: current directory)"
-                        },
-                        "include_remote": {
-                            "type": "boolean",
-                            "description": "Include remote branches",
-                            "default": True
-                        }
-                    },
-                    "required": []
-                }
+            "git-commit-info": bind_tool_arguments(
+                self._git_commit_info, ("path", "."), ("count", 10)
             ),
-            Tool(
-                name="git-commit-info",
-                description="Get recent commit information",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Repository path (default: current directory)"
-                        },
-                        "count": {
-                            "type": "integer",
-                            "description": "Number of commits to show",
-                            "default": 10,
-                            "minimum": 1,
-                            "maximum": 100
-                        }
-                    },
-                    "required": []
-                }
+            "git-create-branch": bind_tool_arguments(
+                self._git_create_branch, ("branch_name", None), ("branch_type", None), ("from_branch", None)
             ),
-            Tool(
-                name="git-create-branch",
-                description="Create a new Git branch with XKit naming conventions",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "branch_name": {
-                            "type": "string",
-                            "description": "Name for the new branch"
-                        },
-                        "branch_type": {
-                            "type": "string",
-                            "description": "Type of branch",
-                            "enum": ["feature", "fix", "refactor", "docs", "test"]
-                        },
-                        "from_branch": {
-                            "type": "string",
-                            "description": "Base branch (default: current branch)"
-                        }
-                    },
-                    "required": ["branch_name", "branch_type"]
-                }
+            "git-overview": bind_tool_arguments(
+                self._git_overview, ("path", "."), ("count", 10)
             )
-        ]
+        }
+    
+    async def list_tools(self) -> List[Tool]:
+        """List available Git tools"""
+        return list(_TOOLS)
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a Git tool with given arguments"""
-        if name == "git-status":
-            path = arguments.get("path", ".")
-            return await self._git_status(path)
-        elif name == "git-branch-info":
-            path = arguments.get("path", ".")
-            include_remote = arguments.get("include_remote", True)
-            return await self._git_branch_info(path, include_remote)
-        elif name == "git-commit-info":
-            path = arguments.get("path", ".")
-            count = arguments.get("count", 10)
-            return await self._git_commit_info(path, count)
-        elif name == "git-create-branch":
-            branch_name = arguments.get("branch_name")
-            branch_type = arguments.get("branch_type")
-            from_branch = arguments.get("from_branch")
-            return await self._git_create_branch(branch_name, branch_type, from_branch)
-        else:
+        handler = self._dispatch.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
+    
+    async def call_tools_batch(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """Run a batch of tool calls concurrently, running identical reads once"""
+        shared: Dict[Any, "asyncio.Future[Any]"] = {}
+        tasks = []
+        for call in calls:
+            name = call["name"]
+            arguments = call.get("arguments") or {}
+            key = None
+            if name in _READ_ONLY_TOOLS:
+                try:
+                    key = (name, frozenset(arguments.items()))
+                    hash(key)
+                except TypeError:
+                    key = None
+            
+            if key is None:
+                tasks.append(asyncio.ensure_future(self.call_tool(name, arguments)))
+                continue
+            task = shared.get(key)
+            if task is None:
+                task = shared[key] = asyncio.ensure_future(self.call_tool(name, arguments))
+            tasks.append(task)
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Duplicates got the same dict - hand each repeat its own deep copy
+        seen = set()
+        for index, result in enumerate(results):
+            if isinstance(result, dict):
+                if id(result) in seen:
+                    results[index] = copy.deepcopy(result)
+                seen.add(id(result))
+        return results
     
     async def _run_git_command(self, args: List[str], cwd: str = ".") -> Dict[str, Any]:
         """Run a git command and return result"""
         try:
-            result = subprocess.run(
-                ["git"] + args,
+            # Async subprocess so other tool calls keep running while git works
+            process = await asyncio.create_subprocess_exec(
+                "git", *args,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=30
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
             
+            # Pipes are read as bytes; each stream is trimmed and decoded once,
+            # and empty streams (usually stderr) skip the codec entirely
+            stdout = stdout.strip()
+            stderr = stderr.strip()
             return {
-                "success": result.returncode == 0,
-                "returncode": result.returncode,
-                "stdout": result.stdout.strip(),
-                "stderr": result.stderr.strip()
+                "success": process.returncode == 0,
+                "returncode": process.returncode,
+                "stdout": stdout.decode("utf-8", "replace") if stdout else "",
+                "stderr": stderr.decode("utf-8", "replace") if stderr else ""
             }
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "error": "Git command timed out",
@@ -149,99 +312,252 @@ class XKitGitServer(MCPServer):
                 "returncode": -1
             }
     
+    def _find_repo_root(self, abs_path: str) -> str:
+        """Top of the work tree containing abs_path, abs_path itself outside a repository"""
+        if not os.path.isdir(abs_path):
+            # Let git report the bad path instead of resolving a parent repo
+            return abs_path
+        
+        current = abs_path
+        while not os.path.exists(os.path.join(current, ".git")):
+            parent = os.path.dirname(current)
+            if parent == current:
+                return abs_path
+            current = parent
+        return current
+    
+    def _repo_path(self, path: str) -> str:
+        """Cached work tree root for a tool's path argument"""
+        return self._repo_root(os.path.abspath(path))
+    
+    def _load_repository(self, repo_path: str):
+        """Open a libgit2 repository, None when it can't be opened"""
+        try:
+            discovered = pygit2.discover_repository(repo_path)
+            return pygit2.Repository(discovered) if discovered is not None else None
+        except pygit2.GitError:
+            return None
+    
+    def _open_repository(self, path: str):
+        """libgit2 repository containing path, None to use the git binary instead"""
+        if pygit2 is None:
+            return None
+        return self._repository(self._repo_path(path))
+    
+    async def _libgit2_read(self, read, path: str, *args):
+        """Run a blocking libgit2 read on a worker thread, one at a time per repository"""
+        lock = self._repository_locks.setdefault(self._repo_path(path), threading.Lock())
+        
+        def locked_read():
+            with lock:
+                return read(path, *args)
+        
+        return await asyncio.to_thread(locked_read)
+    
+    def _libgit2_status_lines(self, path: str) -> Optional[List[str]]:
+        """`git status --porcelain -b` lines read in-process, None on any libgit2 failure"""
+        repo = self._open_repository(path)
+        if repo is None:
+            return None
+        
+        try:
+            if repo.head_is_unborn:
+                head_name = repo.references["HEAD"].target
+                branch_line = f"## No commits yet on {head_name.removeprefix('refs/heads/')}"
+            elif repo.head_is_detached:
+                branch_line = "## HEAD (no branch)"
+            else:
+                branch = repo.branches.local[repo.head.shorthand]
+                upstream = branch.upstream
+                branch_line = f"## {branch.branch_name}"
+                if upstream is not None:
+                    branch_line += f"...{upstream.branch_name}"
+                    ahead, behind = repo.ahead_behind(branch.target, upstream.target)
+                    tracking = [f"ahead {ahead}"] if ahead else []
+                    if behind:
+                        tracking.append(f"behind {behind}")
+                    if tracking:
+                        branch_line += f" [{', '.join(tracking)}]"
+            
+            status = repo.status(untracked_files="normal")
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+        
+        # git lists tracked changes first, then untracked paths
+        entries = [(_porcelain_code(flags), file_path) for file_path, flags in sorted(status.items())]
+        entries.sort(key=lambda entry: entry[0] == "??")
+        return [branch_line] + [f"{code} {file_path}" for code, file_path in entries]
+    
+    def _libgit2_branches(self, path: str, include_remote: bool) -> Optional[List[Dict[str, Any]]]:
+        """Branch entries shaped like the parsed `git branch -v` output, None on failure"""
+        repo = self._open_repository(path)
+        if repo is None:
+            return None
+        
+        try:
+            sources = [("", repo.branches.local)]
+            if include_remote:
+                sources.append(("remotes/", repo.branches.remote))
+            
+            branches = []
+            for prefix, collection in sources:
+                for short_name in sorted(collection):
+                    branch = collection[short_name]
+                    name = prefix + short_name
+                    if isinstance(branch.target, str):
+                        # Symbolic ref such as origin/HEAD
+                        target = branch.target.removeprefix("refs/remotes/")
+                        info = f"{name} -> {target}"
+                    else:
+                        commit = repo[branch.target]
+                        info = f"{name} {commit.short_id} {_commit_subject(commit.message)}"
+                    branches.append({
+                        "name": name,
+                        "current": not prefix and branch.is_head(),
+                        "remote": bool(prefix),
+                        "info": info
+                    })
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+        
+        return branches
+    
+    def _libgit2_commits(self, path: str, count: int) -> Optional[List[Dict[str, str]]]:
+        """Latest count commits reachable from HEAD, None on failure"""
+        repo = self._open_repository(path)
+        if repo is None:
+            return None
+        
+        try:
+            walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+            return [
+                {"hash": str(commit.id), "message": _commit_subject(commit.message)}
+                for commit in islice(walker, count)
+            ]
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+    
     async def _git_status(self, path: str) -> Dict[str, Any]:
         """Get Git repository status"""
-        result = await self._run_git_command(["status", "--porcelain", "-b"], cwd=path)
+        repo_path = self._repo_path(path)
+        now = time.monotonic()
+        cached = self._status_cache.get(repo_path)
+        if cached is not None and cached[0] > now:
+            return cached[1].to_dict()
         
-        if not result["success"]:
-            return {
-                "error": "Failed to get git status",
-                "details": result
-            }
+        status_lines = await self._libgit2_read(self._libgit2_status_lines, path)
+        if status_lines is None:
+            result = await self._run_git_command(["status", "--porcelain", "-b"], cwd=repo_path)
+            
+            if not result["success"]:
+                return {
+                    "error": "Failed to get git status",
+                    "details": result
+                }
+            
+            status_lines = result["stdout"].split("\n") if result["stdout"] else []
         
-        status_lines = result["stdout"].split("\n") if result["stdout"] else []
         branch_line = status_lines[0] if status_lines else ""
         file_lines = status_lines[1:] if len(status_lines) > 1 else []
         
-        return {
-            "branch_info": branch_line,
-            "modified_files": len([line for line in file_lines if line.startswith(" M")]),
-            "added_files": len([line for line in file_lines if line.startswith("A ")]),
-            "deleted_files": len([line for line in file_lines if line.startswith(" D")]),
-            "untracked_files": len([line for line in file_lines if line.startswith("??")]),
-            "total_changes": len(file_lines),
-            "clean": len(file_lines) == 0,
-            "files": file_lines,
-            "source": "xkit-git-server"
+        # One pass over the porcelain lines, keyed on the XY status code
+        status_codes = Counter(line[:2] for line in file_lines)
+        
+        status = StatusResult(
+            branch_info=branch_line,
+            modified_files=status_codes[" M"],
+            added_files=status_codes["A "],
+            deleted_files=status_codes[" D"],
+            untracked_files=status_codes["??"],
+            files=tuple(file_lines)
+        )
+        # Drop expired entries so paths polled once don't pile up
+        self._status_cache = {
+            key: entry for key, entry in self._status_cache.items() if entry[0] > now
         }
+        self._status_cache[repo_path] = (now + self.STATUS_CACHE_TTL, status)
+        return status.to_dict()
     
     async def _git_branch_info(self, path: str, include_remote: bool) -> Dict[str, Any]:
         """Get Git branch information"""
-        args = ["branch", "-v"]
-        if include_remote:
-            args.append("-a")
-        
-        result = await self._run_git_command(args, cwd=path)
-        
-        if not result["success"]:
-            return {
-                "error": "Failed to get branch info",
-                "details": result
-            }
-        
-        branches = []
-        current_branch = None
-        
-        for line in result["stdout"].split("\n"):
-            line = line.strip()
-            if line:
-                is_current = line.startswith("*")
-                branch_info = line[2:] if is_current else line
-                parts = branch_info.split()
+        branches = await self._libgit2_read(self._libgit2_branches, path, include_remote)
+        if branches is not None:
+            current_branch = next((b["name"] for b in branches if b["current"]), None)
+            remote_count = sum(b["remote"] for b in branches)
+        else:
+            args = ["for-each-ref", _BRANCH_REF_FORMAT, "refs/heads"]
+            if include_remote:
+                args.append("refs/remotes")
+            
+            result = await self._run_git_command(args, cwd=self._repo_path(path))
+            
+            if not result["success"]:
+                return {
+                    "error": "Failed to get branch info",
+                    "details": result
+                }
+            
+            branches = []
+            current_branch = None
+            remote_count = 0
+            
+            # Single pass over "<refname>\t<HEAD>\t<sha>\t<symref>\t<subject>" lines
+            for line in result["stdout"].split("\n"):
+                fields = line.split("\t", 4)
+                if len(fields) < 3:
+                    continue
                 
-                if parts:
-                    branch_name = parts[0]
-                    if is_current:
-                        current_branch = branch_name
-                    
-                    branches.append({
-                        "name": branch_name,
-                        "current": is_current,
-                        "remote": branch_name.startswith("remotes/"),
-                        "info": branch_info
-                    })
+                refname, head_flag, short_sha = fields[0], fields[1], fields[2]
+                symref = fields[3] if len(fields) > 3 else ""
+                subject = fields[4] if len(fields) > 4 else ""
+                
+                # Same names as `git branch -a`: "main", "remotes/origin/main"
+                is_remote = refname.startswith("refs/remotes/")
+                branch_name = refname[len("refs/"):] if is_remote else refname[len("refs/heads/"):]
+                is_current = head_flag == "*"
+                remote_count += is_remote
+                if is_current:
+                    current_branch = branch_name
+                
+                branches.append({
+                    "name": branch_name,
+                    "current": is_current,
+                    "remote": is_remote,
+                    "info": f"{branch_name} -> {symref}" if symref else f"{branch_name} {short_sha} {subject}"
+                })
         
         return {
             "current_branch": current_branch,
             "branches": branches,
             "total_branches": len(branches),
-            "local_branches": len([b for b in branches if not b["remote"]]),
-            "remote_branches": len([b for b in branches if b["remote"]]),
+            "local_branches": len(branches) - remote_count,
+            "remote_branches": remote_count,
             "source": "xkit-git-server"
         }
     
     async def _git_commit_info(self, path: str, count: int) -> Dict[str, Any]:
         """Get recent commit information"""
-        result = await self._run_git_command(
-            ["log", f"-{count}", "--oneline", "--decorate"],
-            cwd=path
-        )
-        
-        if not result["success"]:
-            return {
-                "error": "Failed to get commit info",
-                "details": result
-            }
-        
-        commits = []
-        for line in result["stdout"].split("\n"):
-            line = line.strip()
-            if line:
-                parts = line.split(" ", 1)
-                if len(parts) >= 2:
+        commits = await self._libgit2_read(self._libgit2_commits, path, count)
+        if commits is None:
+            result = await self._run_git_command(
+                ["log", f"-{count}", "--format=%H%x09%s", "-z"],
+                cwd=self._repo_path(path)
+            )
+            
+            if not result["success"]:
+                return {
+                    "error": "Failed to get commit info",
+                    "details": result
+                }
+            
+            # NUL-terminated "<hash>\t<subject>" records
+            commits = []
+            for record in result["stdout"].split("\0"):
+                commit_hash, _, message = record.partition("\t")
+                if commit_hash:
                     commits.append({
-                        "hash": parts[0],
-                        "message": parts[1]
+                        "hash": commit_hash,
+                        "message": message
                     })
         
         return {
@@ -251,26 +567,43 @@ class XKitGitServer(MCPServer):
             "source": "xkit-git-server"
         }
     
+    async def _git_overview(self, path: str, count: int) -> Dict[str, Any]:
+        """Status, branches and recent commits; git subprocesses overlap, libgit2 reads take turns per repo"""
+        status, branches, commits = await asyncio.gather(
+            self._git_status(path),
+            self._git_branch_info(path, True),
+            self._git_commit_info(path, count)
+        )
+        
+        return {
+            "status": status,
+            "branches": branches,
+            "commits": commits,
+            "source": "xkit-git-server"
+        }
+    
     async def _git_create_branch(self, branch_name: str, branch_type: str, from_branch: Optional[str]) -> Dict[str, Any]:
         """Create a new Git branch with XKit naming conventions"""
         # Apply XKit naming convention
         full_branch_name = f"{branch_type}/{branch_name}"
         
-        # Get current branch if from_branch not specified
+        # Without an explicit base, branch off HEAD in the same git call; the
+        # base name for the response comes from .git/HEAD, not another spawn
+        base_branch = from_branch
         if not from_branch:
-            current_result = await self._run_git_command(["branch", "--show-current"])
-            if current_result["success"]:
-                from_branch = current_result["stdout"] or "main"
-            else:
-                from_branch = "main"
+            from ...infrastructure.git import GitRepository
+            
+            from_branch = "HEAD"
+            base_branch = GitRepository().read_head_branch(Path(self._repo_path("."))) or "HEAD"
         
         # Create branch
         result = await self._run_git_command(["checkout", "-b", full_branch_name, from_branch])
+        self._status_cache.clear()
         
         return {
             "success": result["success"],
             "branch_name": full_branch_name,
-            "base_branch": from_branch,
+            "base_branch": base_branch,
             "branch_type": branch_type,
             "naming_convention": "xkit-standard",
             "details": result,
@@ -3,200 +3,337 @@ Project Analyzer MCP Server
 Provides project analysis functionality through MCP protocol
 """
 import asyncio
+import copy
 import os
 import json
-from typing import Dict, Any, List, Optional
+import time
+from datetime import datetime
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
 from pathlib import Path
-import sys
 
 from ..protocol import MCPServer, Tool
 
 
+# Scripts directory holding the xkit package, fixed per process
+_XKIT_ROOT = Path(__file__).parents[3]
+
+# Metric categories by file suffix
+CODE_SUFFIXES = frozenset({'.py', '.js', '.ts', '.ps1', '.java', '.go', '.rs', '.cpp', '.c', '.jsx', '.tsx'})
+CONFIG_SUFFIXES = frozenset({'.json', '.yaml', '.yml', '.toml', '.ini'})
+DOC_SUFFIXES = frozenset({'.md', '.rst', '.txt'})
+
+# Technologies a code suffix indicates
+SUFFIX_TECHNOLOGY = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.ps1': 'PowerShell',
+}
+
+# suffix -> (metric category, technology it indicates); one lookup per file
+SUFFIX_CATEGORY = {
+    suffix: (category, SUFFIX_TECHNOLOGY.get(suffix))
+    for category, suffixes in (('code', CODE_SUFFIXES), ('config', CONFIG_SUFFIXES), ('doc', DOC_SUFFIXES))
+    for suffix in suffixes
+}
+_UNCATEGORIZED = (None, None)
+
+# Directory names pruned from every walk (checked per directory, never per file)
+IGNORE_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.vscode', 'dist', 'build'})
+
+# analyze-project also skips what AnalyzeXKitProjectUseCase ignores
+ANALYSIS_IGNORE_DIRS = IGNORE_DIRS | {'.pytest_cache', '.idea'}
+ANALYSIS_IGNORE_SUFFIXES = frozenset({'.pyc', '.log'})
+ANALYSIS_IGNORE_NAMES = frozenset({'.DS_Store', 'Thumbs.db'})
+
+# Report order for detected technologies
+TECHNOLOGY_ORDER = ('Python', 'JavaScript', 'TypeScript', 'PowerShell')
+
+# Bytes read per await when counting subprocess output lines
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# quick-analyze report; optional sections are pre-rendered (with their
+# trailing blank line) and filled in with a single format_map call
+QUICK_ANALYSIS_TEMPLATE = (
+    "📊 RESULTADO COMPLETO:\n"
+    + "=" * 50 + "\n"
+    "📊 **Análise Avançada: {name}**\n"
+    "{score_emoji} **Score: {score:.0f}/10**\n"
+    "\n"
+    "```\n"
+    "📈 Métricas do Projeto:\n"
+    "📁 Total: {total} arquivos\n"
+    "💻 Código: {code} arquivos\n"
+    "🧪 Testes: {tests} arquivos\n"
+    "📚 Docs: {docs} arquivos\n"
+    "⚙️ Config: {config} arquivos\n"
+    "```\n"
+    "\n"
+    "{git_status}\n"
+    "\n"
+    "{technologies}"
+    "{suggestions}"
+    "🕒 **Analisado:** {now:%H:%M:%S}\n"
+    "🚀 **XKit v3.0 - Análise Avançada**"
+)
+GIT_INITIALIZED_STATUS = "✅ **Git inicializado**"
+GIT_MISSING_STATUS = "❌ **Git não inicializado**\n_Considere: `git init`_"
+
+
+def _scan(path: str, ignore_dirs: FrozenSet[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (name, lowercased extension) for every file under path.
+    
+    os.walk lists each directory once with scandir and walks iteratively, so
+    deep trees cost neither recursion depth nor a chain of nested generators.
+    Ignored directories are pruned in place before they are ever listed.
+    """
+    for _, dirnames, filenames in os.walk(path):
+        dirnames[:] = [name for name in dirnames if name not in ignore_dirs]
+        for name in filenames:
+            # Same rule as os.path.splitext - a leading dot is not an extension
+            dot = name.rfind('.')
+            yield name, name[dot:].lower() if dot > 0 else ''
+
+
+def _tally(path: str, ignore_dirs: FrozenSet[str],
+           skip_ignored: bool = False) -> Tuple[Dict[str, int], List[str]]:
+    """Count files per metric category and detect technologies in one streamed pass.
+    
+    Only counters and a small technology set are kept, never the file list.
+    skip_ignored drops the files AnalyzeXKitProjectUseCase ignores.
+    """
+    counts = {'total': 0, 'code': 0, 'test': 0, 'doc': 0, 'config': 0}
+    found = set()
+    
+    for name, suffix in _scan(path, ignore_dirs):
+        if skip_ignored and (suffix in ANALYSIS_IGNORE_SUFFIXES or name in ANALYSIS_IGNORE_NAMES):
+            continue
+        counts['total'] += 1
+        category, technology = SUFFIX_CATEGORY.get(suffix, _UNCATEGORIZED)
+        if category == 'doc' or 'README' in name.upper():
+            counts['doc'] += 1
+        elif category is not None:
+            counts[category] += 1
+        if technology is not None:
+            found.add(technology)
+        if suffix == '.test' or 'test' in name.lower():
+            counts['test'] += 1
+    
+    return counts, [tech for tech in TECHNOLOGY_ORDER if tech in found]
+
+
+def _analysis_inventory(project_path: Path) -> Dict[str, Any]:
+    """File counts and technologies for analyze-project, shared with the use case walk"""
+    counts, technologies = _tally(str(project_path), ANALYSIS_IGNORE_DIRS, skip_ignored=True)
+    return {**counts, 'technologies': technologies}
+
+
+# Static tool schemas - built once at import instead of on every list_tools call
+_TOOLS = (
+    Tool(
+        name="analyze-project",
+        description="Perform comprehensive project analysis with Git and GitHub integration",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to analyze (default: current directory)"
+                },
+                "include_git": {
+                    "type": "boolean",
+                    "description": "Include Git information in analysis",
+                    "default": True
+                },
+                "include_github": {
+                    "type": "boolean", 
+                    "description": "Include GitHub issues and PRs",
+                    "default": True
+                },
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Include detailed analysis",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="quick-analyze",
+        description="Quick project analysis without AI",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to analyze (default: current directory)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="analyze-git-status",
+        description="Analyze Git repository status and recent commits",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Repository path (default: current directory)"
+                },
+                "commit_count": {
+                    "type": "integer",
+                    "description": "Number of recent commits to include",
+                    "default": 3
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="analyze-github-issues",
+        description="Analyze GitHub issues and pull requests",
+        input_schema={
+            "type": "object", 
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Repository path (default: current directory)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of issues to fetch",
+                    "default": 5
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Bypass the short-lived GitHub cache",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+)
+_TOOL_NAMES = tuple(tool.name for tool in _TOOLS)
+
+
+# Message prefixes for captured use case output
+INFO_ICON = "ℹ️ "
+SUCCESS_ICON = "✅ "
+ERROR_ICON = "❌ "
+WARNING_ICON = "⚠️ "
+
+
+class CaptureDisplayService:
+    """Display service that collects messages instead of printing them"""
+    
+    def __init__(self):
+        self.output = []
+    
+    def info(self, message):
+        self.output.append(f"{INFO_ICON}{message}")
+    
+    def success(self, message):
+        self.output.append(f"{SUCCESS_ICON}{message}")
+    
+    def error(self, message):
+        self.output.append(f"{ERROR_ICON}{message}")
+    
+    def warning(self, message):
+        self.output.append(f"{WARNING_ICON}{message}")
+
+
+async def _empty() -> Dict[str, Any]:
+    """Placeholder result for a skipped analysis step"""
+    return {}
+
+
 class XKitProjectAnalyzerServer(MCPServer):
     """Project analysis functionality MCP server"""
     
+    # Seconds GitHub issue/PR listings are reused for the same repository
+    GITHUB_CACHE_TTL = 60.0
+    # Project directories whose repository identity is remembered
+    REPO_KEY_CACHE_SIZE = 64
+    
+    # Seconds a git/gh call may take before it is killed and treated as failed
+    COMMAND_TIMEOUT = 10.0
+    
     def __init__(self):
         super().__init__("xkit-project-analyzer", "1.0.0")
-        self.xkit_root = Path(__file__).parent.parent.parent.parent
+        self.xkit_root = _XKIT_ROOT
+        
+        # Whether the gh CLI is installed - probed once, can't change mid-process
+        self._gh_available: Optional[bool] = None
+        
+        # (repository, limit) -> (fetched at, github info); project dir -> repository
+        self._gh_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+        self._repo_keys: Dict[str, str] = {}
+        
+        # Tool name -> handler(arguments); each handler reports its own failures
+        self._handlers = {
+            "analyze-project": self._analyze_project_full,
+            "quick-analyze": self._quick_analyze,
+            "analyze-git-status": self._analyze_git_status,
+            "analyze-github-issues": self._analyze_github_issues
+        }
     
     async def list_tools(self) -> List[Tool]:
         """List available project analysis tools"""
-        return [
-            Tool(
-                name="analyze-project",
-                description="Perform comprehensive project analysis with Git and GitHub integration",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to analyze (default: current directory)"
-                        },
-                        "include_git": {
-                            "type": "boolean",
-                            "description": "Include Git information in analysis",
-                            "default": True
-                        },
-                        "include_github": {
-                            "type": "boolean", 
-                            "description": "Include GitHub issues and PRs",
-                            "default": True
-                        },
-                        "detailed": {
-                            "type": "boolean",
-                            "description": "Include detailed analysis",
-                            "default": False
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="quick-analyze",
-                description="Quick project analysis without AI",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to analyze (default: current directory)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="analyze-git-status",
-                description="Analyze Git repository status and recent commits",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Repository path (default: current directory)"
-                        },
-                        "commit_count": {
-                            "type": "integer",
-                            "description": "Number of recent commits to include",
-                            "default": 3
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="analyze-github-issues",
-                description="Analyze GitHub issues and pull requests",
-                input_schema={
-                    "type": "object", 
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Repository path (default: current directory)"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of issues to fetch",
-                            "default": 5
-                        }
-                    },
-                    "required": []
-                }
-            )
-        ]
+        return list(_TOOLS)
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute project analysis tool"""
-        try:
-            if name == "analyze-project":
-                return await self._analyze_project_full(arguments)
-            elif name == "quick-analyze":
-                return await self._quick_analyze(arguments)
-            elif name == "analyze-git-status":
-                return await self._analyze_git_status(arguments)
-            elif name == "analyze-github-issues":
-                return await self._analyze_github_issues(arguments)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown tool: {name}",
-                    "available_tools": [tool.name for tool in await self.list_tools()]
-                }
-        
-        except Exception as e:
+        handler = self._handlers.get(name)
+        if handler is None:
             return {
                 "success": False,
-                "error": f"Tool execution failed: {str(e)}",
-                "tool": name,
-                "arguments": arguments
+                "error": f"Unknown tool: {name}",
+                "available_tools": list(_TOOL_NAMES)
             }
+        return await handler(arguments)
     
     async def _analyze_project_full(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Full project analysis with all features"""
         try:
+            # Lazy: importing the xkit package loads every infrastructure
+            # service (AI, Telegram, ...), which the other tools never need
             from xkit.application.use_cases import AnalyzeXKitProjectUseCase
-            from xkit.infrastructure.display import DisplayService
             
             path = args.get("path", os.getcwd())
             include_git = args.get("include_git", True)
             include_github = args.get("include_github", True)
             detailed = args.get("detailed", False)
             
-            # Create a display service that captures output
-            class CaptureDisplayService:
-                def __init__(self):
-                    self.output = []
-                
-                def info(self, message):
-                    self.output.append(f"ℹ️ {message}")
-                
-                def success(self, message):
-                    self.output.append(f"✅ {message}")
-                
-                def error(self, message):
-                    self.output.append(f"❌ {message}")
-                
-                def warning(self, message):
-                    self.output.append(f"⚠️ {message}")
-            
             display_service = CaptureDisplayService()
-            use_case = AnalyzeXKitProjectUseCase(display_service)
+            use_case = AnalyzeXKitProjectUseCase(display_service, _analysis_inventory)
             
             # Execute analysis
             await use_case.execute(path)
             
-            # Get basic project metrics
+            # The use case already walked the tree if it analyzed the structure;
+            # otherwise walk here (in a worker thread) alongside Git and GitHub,
+            # which don't depend on each other - latency is the slowest step
             project_path = Path(path)
-            files = list(project_path.rglob("*"))
-            files = [f for f in files if f.is_file() and not use_case._should_ignore_file(f)]
-            
-            code_files = [f for f in files if f.suffix in ['.py', '.js', '.ts', '.ps1', '.java', '.go', '.rs', '.cpp', '.c']]
-            config_files = [f for f in files if f.suffix in ['.json', '.yaml', '.yml', '.toml', '.ini']]
-            doc_files = [f for f in files if f.suffix in ['.md', '.rst', '.txt'] or 'README' in f.name.upper()]
-            
-            # Technologies
-            technologies = []
-            if any(f.suffix == '.py' for f in code_files):
-                technologies.append('Python')
-            if any(f.suffix in ['.js', '.jsx'] for f in code_files):
-                technologies.append('JavaScript')
-            if any(f.suffix in ['.ts', '.tsx'] for f in code_files):
-                technologies.append('TypeScript')
-            if any(f.suffix == '.ps1' for f in code_files):
-                technologies.append('PowerShell')
-            
-            # Git info if requested
-            git_info = {}
-            if include_git and (project_path / ".git").exists():
-                git_info = await self._get_git_info(project_path)
-            
-            # GitHub info if requested
-            github_info = {}
-            if include_github:
-                github_info = await self._get_github_info(project_path)
+            inventory = use_case.last_inventory
+            walk = asyncio.to_thread(_analysis_inventory, project_path) if inventory is None else _empty()
+            walked, git_info, github_info = await asyncio.gather(
+                walk,
+                self._get_git_info(project_path) if include_git and (project_path / ".git").exists() else _empty(),
+                self._get_github_info(project_path) if include_github else _empty()
+            )
+            inventory = inventory or walked
+            total_files, code_files = inventory['total'], inventory['code']
+            config_files, doc_files = inventory['config'], inventory['doc']
+            technologies = inventory['technologies']
             
             # Calculate score
-            score = self._calculate_score(len(files), len(code_files), len(doc_files), bool(git_info))
+            score = self._calculate_score(total_files, code_files, doc_files, bool(git_info))
             
             result = {
                 "success": True,
@@ -204,10 +341,10 @@ class XKitProjectAnalyzerServer(MCPServer):
                     "project_name": project_path.name,
                     "path": str(project_path),
                     "metrics": {
-                        "total_files": len(files),
-                        "code_files": len(code_files),
-                        "config_files": len(config_files),
-                        "doc_files": len(doc_files)
+                        "total_files": total_files,
+                        "code_files": code_files,
+                        "config_files": config_files,
+                        "doc_files": doc_files
                     },
                     "technologies": technologies,
                     "score": score,
@@ -237,45 +374,27 @@ class XKitProjectAnalyzerServer(MCPServer):
                     "error": f"Path does not exist: {path}"
                 }
             
-            # Basic file counting
-            files = list(project_path.rglob("*"))
-            files = [f for f in files if f.is_file()]
-            
-            # Filter common ignore patterns
-            ignore_patterns = ['.git', '__pycache__', 'node_modules', '.vscode', 'dist', 'build']
-            files = [f for f in files if not any(pattern in str(f) for pattern in ignore_patterns)]
-            
-            code_files = [f for f in files if f.suffix in ['.py', '.js', '.ts', '.ps1', '.java', '.go', '.rs', '.cpp', '.c']]
-            test_files = [f for f in files if 'test' in f.name.lower() or f.suffix == '.test']
-            doc_files = [f for f in files if f.suffix in ['.md', '.rst', '.txt'] or 'README' in f.name.upper()]
-            config_files = [f for f in files if f.suffix in ['.json', '.yaml', '.yml', '.toml', '.ini']]
-            
-            # Technology detection
-            technologies = []
-            if any(f.suffix == '.py' for f in code_files):
-                technologies.append('Python')
-            if any(f.suffix in ['.js', '.jsx'] for f in code_files):
-                technologies.append('JavaScript')
-            if any(f.suffix in ['.ts', '.tsx'] for f in code_files):
-                technologies.append('TypeScript')
-            if any(f.suffix == '.ps1' for f in code_files):
-                technologies.append('PowerShell')
+            # File counting and technology detection in a single streamed pass;
+            # common ignore dirs are pruned
+            counts, technologies = _tally(path, IGNORE_DIRS)
+            total_files, code_files, test_files = counts['total'], counts['code'], counts['test']
+            config_files, doc_files = counts['config'], counts['doc']
             
             # Git status
             git_initialized = (project_path / ".git").exists()
             
             # Simple scoring
-            score = self._calculate_score(len(files), len(code_files), len(doc_files), git_initialized)
+            score = self._calculate_score(total_files, code_files, doc_files, git_initialized)
             
             # Generate suggestions
             suggestions = []
             if not git_initialized:
                 suggestions.append("🌿 Inicializar Git: `git init`")
-            if len(doc_files) == 0:
+            if doc_files == 0:
                 suggestions.append("📚 Adicionar documentação: README.md")
-            if len(test_files) == 0 and len(code_files) > 5:
+            if test_files == 0 and code_files > 5:
                 suggestions.append("🧪 Adicionar testes unitários")
-            if len(config_files) == 0:
+            if config_files == 0:
                 suggestions.append("⚙️ Adicionar arquivos de configuração")
             
             return {
@@ -283,21 +402,21 @@ class XKitProjectAnalyzerServer(MCPServer):
                 "project_name": project_path.name,
                 "score": score,
                 "metrics": {
-                    "total_files": len(files),
-                    "code_files": len(code_files), 
-                    "test_files": len(test_files),
-                    "doc_files": len(doc_files),
-                    "config_files": len(config_files)
+                    "total_files": total_files,
+                    "code_files": code_files, 
+                    "test_files": test_files,
+                    "doc_files": doc_files,
+                    "config_files": config_files
                 },
                 "technologies": technologies,
                 "git_initialized": git_initialized,
                 "suggestions": suggestions,
                 "formatted_output": self._format_quick_analysis(project_path.name, score, {
-                    "total": len(files),
-                    "code": len(code_files),
-                    "tests": len(test_files), 
-                    "docs": len(doc_files),
-                    "config": len(config_files)
+                    "total": total_files,
+                    "code": code_files,
+                    "tests": test_files, 
+                    "docs": doc_files,
+                    "config": config_files
                 }, technologies, git_initialized, suggestions)
             }
             
@@ -310,8 +429,6 @@ class XKitProjectAnalyzerServer(MCPServer):
     async def _analyze_git_status(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze Git status and recent commits"""
         try:
-            import subprocess
-            
             path = args.get("path", os.getcwd())
             commit_count = args.get("commit_count", 3)
             project_path = Path(path)
@@ -338,13 +455,12 @@ class XKitProjectAnalyzerServer(MCPServer):
     async def _analyze_github_issues(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze GitHub issues and PRs"""
         try:
-            import subprocess
-            
             path = args.get("path", os.getcwd())
             limit = args.get("limit", 5)
+            refresh = args.get("refresh", False)
             project_path = Path(path)
             
-            github_info = await self._get_github_info(project_path, limit)
+            github_info = await self._get_github_info(project_path, limit, refresh)
             
             return {
                 "success": True,
@@ -357,40 +473,92 @@ class XKitProjectAnalyzerServer(MCPServer):
                 "error": f"GitHub analysis failed: {str(e)}"
             }
     
+    async def _run(self, command: List[str], cwd: Optional[Path] = None,
+                   timeout: Optional[float] = None) -> Tuple[int, str]:
+        """Run a command without blocking the event loop, returns (returncode, stdout)
+        
+        A command that outlives the timeout (e.g. gh waiting on the network)
+        is killed and reported as returncode -1.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout or self.COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return -1, ""
+        return process.returncode, stdout.decode('utf-8', 'replace')
+    
+    async def _count_lines(self, command: List[str], cwd: Optional[Path] = None) -> Tuple[int, int]:
+        """Run a command and count its output lines, returns (returncode, lines)
+        
+        stdout is consumed in fixed-size chunks, so a huge listing (e.g. a
+        status with 100k changed files) never sits in memory as one string.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        
+        async def count() -> int:
+            lines = 0
+            while True:
+                chunk = await process.stdout.read(OUTPUT_CHUNK_SIZE)
+                if not chunk:
+                    return lines
+                lines += chunk.count(b'\n')
+        
+        try:
+            lines = await asyncio.wait_for(count(), self.COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return -1, 0
+        return await process.wait(), lines
+    
     async def _get_git_info(self, project_path: Path, commit_count: int = 3) -> Dict[str, Any]:
         """Get Git repository information"""
-        import subprocess
-        
         git_info = {}
         
         try:
+            # Branch, recent commits and status don't depend on each other
+            branch, log, status = await asyncio.gather(
+                self._run(['git', 'branch', '--show-current'], project_path),
+                self._run(['git', 'log', f'-{commit_count}', '-z', '--format=%h%x1f%s%x1f%an%x1f%ar'], project_path),
+                self._count_lines(['git', 'status', '--porcelain'], project_path)
+            )
+            
             # Current branch
-            result = subprocess.run(['git', 'branch', '--show-current'], 
-                                  cwd=project_path, capture_output=True, text=True)
-            git_info['current_branch'] = result.stdout.strip() if result.returncode == 0 else "unknown"
+            returncode, stdout = branch
+            git_info['current_branch'] = stdout.strip() if returncode == 0 else "unknown"
             
-            # Recent commits
-            result = subprocess.run(['git', 'log', f'-{commit_count}', '--format=%h|%s|%an|%ar'], 
-                                  cwd=project_path, capture_output=True, text=True)
-            if result.returncode == 0:
+            # Recent commits - NUL between records and US between fields, so
+            # '|' or newlines in subjects and author names can't split a commit
+            returncode, stdout = log
+            if returncode == 0:
                 commits = []
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        parts = line.strip().split('|', 3)
-                        if len(parts) == 4:
-                            commits.append({
-                                'hash': parts[0],
-                                'message': parts[1],
-                                'author': parts[2],
-                                'date': parts[3]
-                            })
+                for record in stdout.split('\x00'):
+                    parts = record.split('\x1f', 3)
+                    if len(parts) == 4:
+                        commits.append({
+                            'hash': parts[0],
+                            'message': parts[1],
+                            'author': parts[2],
+                            'date': parts[3]
+                        })
                 git_info['recent_commits'] = commits
             
-            # Modified files
-            result = subprocess.run(['git', 'status', '--porcelain'], 
-                                  cwd=project_path, capture_output=True, text=True)
-            if result.returncode == 0:
-                modified_files = len([f for f in result.stdout.split('\n') if f.strip()])
+            # Modified files - one porcelain line per entry (renames included,
+            # odd paths are quoted), so counting newlines is exact
+            returncode, modified_files = status
+            if returncode == 0:
                 git_info['modified_files'] = modified_files
             
         except Exception as e:
@@ -398,42 +566,80 @@ class XKitProjectAnalyzerServer(MCPServer):
         
         return git_info
     
-    async def _get_github_info(self, project_path: Path, limit: int = 5) -> Dict[str, Any]:
-        """Get GitHub issues and PRs information"""
-        import subprocess
+    async def _repo_key(self, project_path: Path) -> str:
+        """Identify the repository behind a directory (origin URL, else the path)"""
+        path_key = os.path.abspath(project_path)
+        repo_key = self._repo_keys.get(path_key)
+        if repo_key is None:
+            try:
+                returncode, stdout = await self._run(['git', 'config', '--get', 'remote.origin.url'], project_path)
+            except OSError:
+                returncode, stdout = 1, ''
+            repo_key = stdout.strip() if returncode == 0 and stdout.strip() else path_key
+            if len(self._repo_keys) >= self.REPO_KEY_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._repo_keys[next(iter(self._repo_keys))]
+            self._repo_keys[path_key] = repo_key
+        return repo_key
+    
+    async def _get_github_info(self, project_path: Path, limit: int = 5, refresh: bool = False) -> Dict[str, Any]:
+        """Get GitHub issues and PRs information, reusing recent answers"""
+        key = (await self._repo_key(project_path), limit)
+        now = time.monotonic()
+        cached = self._gh_cache.get(key)
+        if not refresh and cached is not None and now - cached[0] < self.GITHUB_CACHE_TTL:
+            # Deep copy: the issue/PR lists stay owned by the cache
+            return copy.deepcopy(cached[1])
         
+        github_info = await self._fetch_github_info(project_path, limit)
+        if 'error' not in github_info:
+            # Drop expired listings so repositories queried once don't pile up
+            self._gh_cache = {
+                cache_key: entry for cache_key, entry in self._gh_cache.items()
+                if now - entry[0] < self.GITHUB_CACHE_TTL
+            }
+            self._gh_cache[key] = (now, copy.deepcopy(github_info))
+        return github_info
+    
+    async def _fetch_github_info(self, project_path: Path, limit: int) -> Dict[str, Any]:
+        """Query gh for open issues and PRs"""
         github_info = {}
         
         try:
             # Check if gh CLI is available
-            result = subprocess.run(['gh', '--version'], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
+            if self._gh_available is None:
+                try:
+                    returncode, _ = await self._run(['gh', '--version'])
+                    self._gh_available = returncode == 0
+                except FileNotFoundError:
+                    self._gh_available = False
+            if not self._gh_available:
                 github_info['error'] = "GitHub CLI (gh) not installed"
                 return github_info
             
-            # Get open issues
-            result = subprocess.run(['gh', 'issue', 'list', '--state', 'open', '--limit', str(limit),
-                                   '--json', 'number,title,author,createdAt,labels'], 
-                                  cwd=project_path, capture_output=True, text=True)
+            # Open issues and PRs are separate API round-trips - run them together
+            issues, prs = await asyncio.gather(
+                self._run(['gh', 'issue', 'list', '--state', 'open', '--limit', str(limit),
+                           '--json', 'number,title,author,createdAt,labels'], project_path),
+                self._run(['gh', 'pr', 'list', '--state', 'open', '--limit', '3',
+                           '--json', 'number,title,author,createdAt'], project_path)
+            )
             
-            if result.returncode == 0:
-                import json
+            # Get open issues
+            returncode, stdout = issues
+            if returncode == 0:
                 try:
-                    issues_data = json.loads(result.stdout)
+                    issues_data = json.loads(stdout)
                     github_info['open_issues'] = issues_data
                     github_info['open_issues_count'] = len(issues_data)
                 except json.JSONDecodeError:
                     github_info['issues_error'] = "Failed to parse issues data"
             
             # Get open PRs
-            result = subprocess.run(['gh', 'pr', 'list', '--state', 'open', '--limit', '3',
-                                   '--json', 'number,title,author,createdAt'], 
-                                  cwd=project_path, capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            returncode, stdout = prs
+            if returncode == 0:
                 try:
-                    prs_data = json.loads(result.stdout)
+                    prs_data = json.loads(stdout)
                     github_info['open_prs'] = prs_data
                     github_info['open_prs_count'] = len(prs_data)
                 except json.JSONDecodeError:
@@ -478,49 +684,20 @@ class XKitProjectAnalyzerServer(MCPServer):
         else:
             score_emoji = "🔴"
         
-        output = [
-            "📊 RESULTADO COMPLETO:",
-            "=" * 50,
-            f"📊 **Análise Avançada: {project_name}**",
-            f"{score_emoji} **Score: {score:.0f}/10**",
-            "",
-            "```",
-            "📈 Métricas do Projeto:",
-            f"📁 Total: {metrics['total']} arquivos",
-            f"💻 Código: {metrics['code']} arquivos", 
-            f"🧪 Testes: {metrics['tests']} arquivos",
-            f"📚 Docs: {metrics['docs']} arquivos",
-            f"⚙️ Config: {metrics['config']} arquivos",
-            "```",
-            "",
-            f"{'✅' if git_initialized else '❌'} **Git {'inicializado' if git_initialized else 'não inicializado'}**"
-        ]
-        
-        if not git_initialized:
-            output.append("_Considere: `git init`_")
-        
-        output.append("")
-        
-        if technologies:
-            output.extend([
-                "🛠️ **Tecnologias:**",
-                *[f"• {tech}" for tech in technologies],
-                ""
-            ])
-        
-        if suggestions:
-            output.extend([
-                "💡 **Sugestões:**",
-                *[f"• {suggestion}" for suggestion in suggestions],
-                ""
-            ])
-        
-        # Add timestamp
-        from datetime import datetime
-        now = datetime.now()
-        output.extend([
-            f"🕒 **Analisado:** {now.strftime('%H:%M:%S')}",
-            "🚀 **XKit v3.0 - Análise Avançada**"
-        ])
+        technologies_section = "".join(
+            ["🛠️ **Tecnologias:**\n", *[f"• {tech}\n" for tech in technologies], "\n"]
+        ) if technologies else ""
+        suggestions_section = "".join(
+            ["💡 **Sugestões:**\n", *[f"• {suggestion}\n" for suggestion in suggestions], "\n"]
+        ) if suggestions else ""
         
-        return "\n".join(output)
\ No newline at end of file
+        return QUICK_ANALYSIS_TEMPLATE.format_map({
+            "name": project_name,
+            "score_emoji": score_emoji,
+            "score": score,
+            **metrics,
+            "git_status": GIT_INITIALIZED_STATUS if git_initialized else GIT_MISSING_STATUS,
+            "technologies": technologies_section,
+            "suggestions": suggestions_section,
+            "now": datetime.now()
+        })
\ No newline at end of file
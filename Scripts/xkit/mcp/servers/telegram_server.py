@@ -6,19 +6,322 @@ Allows communication between XKit and Telegram Bot with access to all plugins
 import asyncio
 import json
 import logging
-import threading
+import os
+import random
 import subprocess
+import sys
 import time
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime
 from pathlib import Path
 
 from ..protocol import MCPServer, Tool
 
 
+# Worker threads for blocking Telegram API calls
+TELEGRAM_IO_WORKERS = 4
+
+# Telegram rejects sendMessage texts longer than this
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+
+def _split_message(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    """Split text into Telegram-sized chunks, preferring line boundaries"""
+    if len(text) <= limit:
+        return [text]
+    
+    chunks = []
+    current = ""
+    for line in text.split("\n"):
+        # A single oversized line is cut hard
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        
+        if not current:
+            current = line
+        elif len(current) + 1 + len(line) <= limit:
+            current = f"{current}\n{line}"
+        else:
+            chunks.append(current)
+            current = line
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+# Source file extension -> technology reported by /analyze
+_EXT_TO_TECH = {
+    '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+    '.jsx': 'React', '.tsx': 'React TypeScript', '.java': 'Java',
+    '.cs': 'C#', '.cpp': 'C++', '.c': 'C', '.go': 'Go',
+    '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby', '.kt': 'Kotlin',
+    '.swift': 'Swift'
+}
+
+# File classification for /analyze, built once at import
+_DOC_EXTS = frozenset({'.md', '.txt', '.rst', '.adoc', '.wiki'})
+_CONFIG_EXTS = frozenset({'.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.xml', '.env'})
+_CONFIG_NAMES = frozenset({'dockerfile', 'makefile', 'rakefile', 'gemfile'})
+_TEST_MARKERS = ('.test.', '.spec.', '_test.', '_spec.')
+_SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'target', 'build', 'dist', 'venv', 'env'})
+_KEPT_DOTFILES = frozenset({'.env', '.gitignore', '.dockerignore'})
+
+# /analyze stops walking after this many entries or seconds and reports a partial result
+SCAN_ENTRY_BUDGET = 20000
+SCAN_TIME_BUDGET = 2.0
+# Technologies listed in the /analyze report; the scan stops collecting after this many
+REPORT_TECH_LIMIT = 3
+
+# (epoch second, '%H:%M:%S', '%Y-%m-%d %H:%M:%S') of the last formatted timestamp
+_timestamp_cache = (-1, "", "")
+
+
+def _now_strs():
+    """Current (time, date time) strings, formatted at most once per wall-clock second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != second:
+        now = datetime.fromtimestamp(second)
+        cached = (second, now.strftime('%H:%M:%S'), now.strftime('%Y-%m-%d %H:%M:%S'))
+        _timestamp_cache = cached
+    return cached[1], cached[2]
+
+
+# Static Telegram text, built once at import
+TELEGRAM_HELP_MSG = """🤖 **XKit Telegram Bot - Comandos Disponíveis**
+
+📊 **Análise de Projetos:**
+/analyze - Analisar projeto atual
+/analyze /path/to/project - Analisar projeto específico
+
+🔧 **Sistema:**
+/status - Status completo do XKit
+/plugins - Listar plugins disponíveis
+
+🌿 **Git:**
+/git - Status do repositório atual
+/git /path/to/repo - Status de repositório específico
+
+❓ **Ajuda:**
+/help - Esta mensagem de ajuda
+
+🚀 **XKit v3.0 - Hybrid MCP Architecture**
+Desenvolvido com ❤️ para desenvolvedores"""
+
+_STATIC_PLUGINS_BLOCK = (
+    "\n\n🧩 **Plugins:**"
+    "\n• Project Analyzer: ✅ Ativo"
+    "\n• Telegram Bot: ✅ Ativo"
+    "\n• MCP Servers: ✅ Funcionando"
+)
+
+_STATIC_MCP_BLOCK = (
+    "\n\n🔌 **MCP Servers:**"
+    "\n• xkit-core: ✅ Ativo"
+    "\n• xkit-ai: ✅ Ativo"
+    "\n• xkit-git: ✅ Ativo"
+    "\n• telegram-bot: ✅ Ativo"
+)
+
+_SYSTEM_STATUS_BODY = (
+    "\n"
+    "\n"
+    "✅ **Sistema:** Ativo\n"
+    "🏗️ **Arquitetura:** Hybrid MCP v3.0"
+)
+
+# Static tool schemas - built once at import instead of on every list_tools call
+_TOOLS = (
+    Tool(
+        name="send-message",
+        description="Send message to Telegram admin chat",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "Message text to send"
+                },
+                "format": {
+                    "type": "string", 
+                    "description": "Message format",
+                    "enum": ["text", "markdown", "html"],
+                    "default": "markdown"
+                },
+                "reply_markup": {
+                    "type": "object",
+                    "description": "Optional inline keyboard markup"
+                }
+            },
+            "required": ["message"]
+        }
+    ),
+    Tool(
+        name="check-bot-status",
+        description="Check if Telegram bot is online and functioning",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "detailed": {
+                    "type": "boolean", 
+                    "description": "Return detailed status info",
+                    "default": True
+                },
+                "restart_if_offline": {
+                    "type": "boolean",
+                    "description": "Attempt to restart bot if offline",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="send-project-report",
+        description="Send comprehensive project analysis report to Telegram",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "project_path": {
+                    "type": "string",
+                    "description": "Path to project to analyze"
+                },
+                "include_ai": {
+                    "type": "boolean",
+                    "description": "Include AI insights",
+                    "default": True
+                },
+                "include_suggestions": {
+                    "type": "boolean",
+                    "description": "Include improvement suggestions",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="send-system-status",
+        description="Send XKit system status to Telegram",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "include_plugins": {
+                    "type": "boolean",
+                    "description": "Include plugin status",
+                    "default": True
+                },
+                "include_mcp": {
+                    "type": "boolean", 
+                    "description": "Include MCP server status",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="send-git-status",
+        description="Send Git repository status to Telegram",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "repo_path": {
+                    "type": "string",
+                    "description": "Repository path"
+                },
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Include detailed file changes",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="handle-telegram-command",
+        description="Process command received from Telegram bot",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "Command from Telegram chat"
+                },
+                "args": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Command arguments"
+                },
+                "user_id": {
+                    "type": "string",
+                    "description": "Telegram user ID"
+                },
+                "chat_id": {
+                    "type": "string",
+                    "description": "Telegram chat ID"
+                }
+            },
+            "required": ["command"]
+        }
+    ),
+    Tool(
+        name="setup-webhook",
+        description="Setup Telegram webhook for real-time communication",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "webhook_url": {
+                    "type": "string",
+                    "description": "Public webhook URL"
+                },
+                "secret_token": {
+                    "type": "string",
+                    "description": "Secret token for webhook validation"
+                }
+            },
+            "required": ["webhook_url"]
+        }
+    ),
+    Tool(
+        name="get-bot-info",
+        description="Get Telegram bot information and status",
+        input_schema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+)
+
+
 class TelegramMCPServer(MCPServer):
     """Telegram Bot MCP Server - Bridge between MCP and Telegram"""
     
+    # Seconds a /analyze or /git report is reused while the directory is unchanged
+    REPORT_CACHE_TTL = 30.0
+    # Upper bound for cached reports (least recently used are evicted)
+    REPORT_CACHE_SIZE = 128
+    # Substring identifying a running polling script in a process command line
+    POLLING_PROCESS_MARKER = "telegram-bot-polling"
+    # Bot monitor: check interval while healthy, and the failure backoff
+    # (BACKOFF_BASE * 2**failures, capped, plus up to BACKOFF_JITTER random seconds)
+    MONITOR_INTERVAL = 60.0
+    # Seconds a freshly spawned polling process must stay alive to count as started / gets to exit on terminate
+    POLLING_STARTUP_TIMEOUT = 3.0
+    POLLING_STOP_TIMEOUT = 2.0
+    BACKOFF_BASE = 60.0
+    BACKOFF_CAP = 900.0
+    BACKOFF_JITTER = 5.0
+    
     def __init__(self):
         super().__init__("telegram-bot", "1.0.0")
         self.description = "Telegram Bot integration with full XKit access"
@@ -27,23 +330,131 @@ class TelegramMCPServer(MCPServer):
         # Telegram service (initialized on demand)
         self._telegram_service = None
         self._config = None
+        # Parsed "telegram" config section, kept until reload_config()
+        self._telegram_config = None
+        # Serializes first-call initialization of concurrent tool calls
+        self._init_lock = asyncio.Lock()
         
         # Bot monitoring and management
         self._bot_online = False
-        self._polling_process = None
-        self._monitor_thread = None
+        self._polling_process: Optional[asyncio.subprocess.Process] = None
+        self._monitor_task: Optional[asyncio.Task] = None
         self._should_monitor = False
         self._last_health_check = None
+        self._consec_failures = 0
         self._auto_start_enabled = True
+        
+        # Sends go through the service's aiohttp session; the remaining blocking
+        # calls get their own small pool instead of the loop's default executor
+        self._io_pool = ThreadPoolExecutor(max_workers=TELEGRAM_IO_WORKERS, thread_name_prefix="tg-io")
+        
+        # (kind, abs path, dir mtime, options) -> (created at, report)
+        self._report_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        
+        # Project analyzer and git repository, built on first use and then reused
+        self._analyzer = None
+        self._analyzer_lock = asyncio.Lock()
+        self._git_repo = None
+        
+        # Tool name -> handler(arguments), bound once instead of per call
+        self._handlers = {
+            "send-message": self._handle_send_message,
+            "check-bot-status": self._handle_check_bot_status,
+            "send-project-report": self._handle_send_project_report,
+            "send-system-status": self._handle_send_system_status,
+            "send-git-status": self._handle_send_git_status,
+            "handle-telegram-command": self._handle_telegram_command,
+            "setup-webhook": self._handle_setup_webhook,
+            "get-bot-info": self._handle_get_bot_info
+        }
+        
+        # Telegram command -> handler(args, user_id, chat_id)
+        self._commands = {
+            "/start": self._cmd_help,
+            "/help": self._cmd_help,
+            "/status": self._cmd_status,
+            "/analyze": self._cmd_analyze,
+            "/git": self._cmd_git,
+            "/plugins": self._cmd_plugins
+        }
+    
+    async def _send_report(self, text: str) -> bool:
+        """Send text to Telegram, split into several messages when over the size limit
+        
+        Chunks go out one after another on the kept-alive session rather than
+        concurrently, so they can't arrive in the chat out of order.
+        """
+        success = True
+        for chunk in _split_message(text):
+            success = await self._telegram_service._send_message_async(chunk) and success
+        return success
+    
+    async def _cached_report(self, key: tuple, path: str, build) -> str:
+        """Return a recent report for an unchanged directory, or build and cache a new one
+        
+        The key includes the directory's mtime, so adding or removing top-level
+        entries invalidates it; anything else is bounded by REPORT_CACHE_TTL.
+        """
+        key = self._report_cache_key(key, path)
+        if key is None:
+            # Missing path - let the builder produce its error message
+            return await build()
+        
+        now = time.monotonic()
+        cached = self._report_cache.get(key)
+        if cached is not None and now - cached[0] < self.REPORT_CACHE_TTL:
+            self._report_cache.move_to_end(key)
+            return cached[1]
+        
+        report = await build()
+        self._report_cache[key] = (now, report)
+        self._report_cache.move_to_end(key)
+        if len(self._report_cache) > self.REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+        return report
+    
+    def _report_cache_key(self, key: tuple, path: str) -> Optional[tuple]:
+        """Full cache key for a report on path, None if the path can't be stat'ed"""
+        try:
+            resolved = os.path.realpath(path)
+            return (*key, resolved, os.stat(resolved).st_mtime_ns)
+        except OSError:
+            return None
+    
+    def _has_fresh_report(self, key: tuple, path: str) -> bool:
+        """Whether _cached_report would answer from the cache right now"""
+        cached = self._report_cache.get(self._report_cache_key(key, path))
+        return cached is not None and time.monotonic() - cached[0] < self.REPORT_CACHE_TTL
+    
+    async def _get_analyzer(self):
+        """Shared XKitProjectAnalyzerPlugin, initialized once even under concurrent reports"""
+        if self._analyzer is None:
+            async with self._analyzer_lock:
+                if self._analyzer is None:
+                    from ...plugins.project_analyzer_plugin import XKitProjectAnalyzerPlugin
+                    
+                    analyzer = XKitProjectAnalyzerPlugin()
+                    await analyzer._initialize_services()
+                    self._analyzer = analyzer
+        return self._analyzer
+    
+    async def _run_io(self, func, *args):
+        """Run a blocking Telegram service call on the I/O pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, func, *args)
     
     async def initialize(self) -> bool:
         """Initialize the telegram service with monitoring"""
+        if self._telegram_service is not None:
+            return True
+        
         try:
             from ...infrastructure.config import XKitConfigService
             from ...infrastructure.telegram_service import TelegramService
             
-            self._config = XKitConfigService()
-            telegram_config = self._config.get_section("telegram")
+            if self._telegram_config is None:
+                self._config = XKitConfigService()
+                self._telegram_config = self._config.get_section("telegram") or {}
+            telegram_config = self._telegram_config
             
             if not telegram_config or not telegram_config.get("enabled", False):
                 self.logger.warning("🤖 Telegram not enabled in config")
@@ -73,6 +484,22 @@ class TelegramMCPServer(MCPServer):
             self.logger.error(f"❌ Failed to initialize Telegram MCP Server: {e}")
             return False
     
+    async def reload_config(self) -> None:
+        """Drop the cached config and service so the next initialize re-reads token/admin_id/enabled"""
+        async with self._init_lock:
+            service, self._telegram_service = self._telegram_service, None
+            self._config = None
+            self._telegram_config = None
+            
+            if service is not None:
+                await service.aclose()
+                service.close()
+    
+    async def _ensure_initialized(self) -> bool:
+        """Single-flight initialize: concurrent first calls wait for one attempt"""
+        async with self._init_lock:
+            return await self.initialize()
+    
     async def _start_bot_monitoring(self):
         """Iniciar sistema de monitoramento do bot"""
         try:
@@ -85,93 +512,112 @@ class TelegramMCPServer(MCPServer):
             if not self._bot_online and self._auto_start_enabled:
                 await self._start_bot_polling()
             
-            # Iniciar thread de monitoramento
-            if not self._monitor_thread or not self._monitor_thread.is_alive():
-                self._monitor_thread = threading.Thread(
-                    target=self._monitor_bot_loop, 
-                    daemon=True
-                )
-                self._monitor_thread.start()
+            # Iniciar tarefa de monitoramento no próprio event loop
+            if self._monitor_task is None or self._monitor_task.done():
+                self._monitor_task = asyncio.create_task(self._monitor_bot_loop())
                 self.logger.info("🔄 Bot monitoring started")
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to start bot monitoring: {e}")
     
-    def _monitor_bot_loop(self):
-        """Loop de monitoramento do bot em thread separada - ANTI-SPAM"""
+    async def _monitor_bot_loop(self):
+        """Loop de monitoramento do bot como tarefa asyncio - ANTI-SPAM"""
         while self._should_monitor:
             try:
-                # Verificar status a cada 30 segundos
-                asyncio.run(self._check_bot_status())
+                # Verificar status do bot
+                healthy = await self._check_bot_status()
                 
                 # ANTI-SPAM: Desabilitar auto-restart temporariamente
                 # Se bot offline, tentar reiniciar (DESABILITADO)
                 if False and not self._bot_online and self._auto_start_enabled:
                     self.logger.warning("🟡 Bot offline, attempting restart...")
                     # Aguardar mais tempo antes de tentar reiniciar
-                    time.sleep(120)  # Esperar 2 minutos
-                    asyncio.run(self._start_bot_polling())
+                    await asyncio.sleep(120)  # Esperar 2 minutos
+                    await self._start_bot_polling()
                 
-                time.sleep(60)  # AUMENTADO: Verificar a cada 60 segundos (menos frequente)
+                if healthy:
+                    await asyncio.sleep(self.MONITOR_INTERVAL)
+                else:
+                    await self._sleep_with_backoff()
                 
             except Exception as e:
                 self.logger.error(f"❌ Error in bot monitoring: {e}")
-                time.sleep(120)  # Esperar ainda mais tempo em caso de erro
+                self._consec_failures += 1
+                await self._sleep_with_backoff(e)
+    
+    async def _sleep_with_backoff(self, err: Optional[BaseException] = None) -> float:
+        """Esperar após falha: Retry-After do Telegram quando houver, senão backoff exponencial com jitter"""
+        delay = self._retry_after_hint(err)
+        if delay is None:
+            exponent = min(self._consec_failures, 16)
+            delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** exponent)
+            delay += random.uniform(0, self.BACKOFF_JITTER)
+        await asyncio.sleep(delay)
+        return delay
+    
+    def _retry_after_hint(self, err: Optional[BaseException]) -> Optional[float]:
+        """Segundos pedidos pelo Telegram (erro com response/parameters ou último 429 do serviço)"""
+        response = getattr(err, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if headers:
+            try:
+                return float(headers['Retry-After'])
+            except (KeyError, TypeError, ValueError):
+                pass
+        
+        parameters = getattr(err, 'parameters', None)
+        retry_after = parameters.get('retry_after') if isinstance(parameters, dict) else getattr(parameters, 'retry_after', None)
+        if retry_after is not None:
+            return float(retry_after)
+        
+        if self._telegram_service is not None and getattr(self._telegram_service, 'retry_after', None):
+            # Consumir o aviso: vale só para a próxima espera
+            retry_after, self._telegram_service.retry_after = self._telegram_service.retry_after, None
+            return retry_after
+        return None
     
     async def _check_bot_status(self) -> bool:
         """Verificar se bot está online e funcionando"""
         try:
             # Verificar se processo de polling está rodando
-            if self._polling_process and self._polling_process.poll() is None:
+            if self._polling_process and self._polling_process.returncode is None:
                 self._bot_online = True
                 self._last_health_check = datetime.now()
+                self._consec_failures = 0
                 return True
             
             # Verificar se pode fazer request para API do Telegram
             if self._telegram_service:
                 try:
-                    bot_info = self._telegram_service.get_bot_info()  # Não é async
+                    # Não é async - roda no pool de I/O para não travar o event loop
+                    bot_info = await self._run_io(self._telegram_service.get_bot_info)
                     if bot_info:
                         self.logger.debug("✅ Bot API responding")
+                        self._consec_failures = 0
                         return True
                 except Exception:
                     pass
             
             self._bot_online = False
+            self._consec_failures += 1
             return False
             
         except Exception as e:
             self.logger.error(f"❌ Bot health check failed: {e}")
             self._bot_online = False
+            self._consec_failures += 1
             return False
     
     async def _start_bot_polling(self) -> bool:
         """Iniciar processo de polling do bot - ANTI-SPAM PROTECTION"""
         try:
-            # ANTI-SPAM: Verificar se já existem processos de polling
-            import psutil
-            telegram_processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    cmdline = proc.info['cmdline'] or []
-                    if any('telegram-bot-polling' in str(cmd) for cmd in cmdline):
-                        telegram_processes.append(proc.info['pid'])
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            if telegram_processes:
-                self.logger.warning(f"🚫 ANTI-SPAM: {len(telegram_processes)} processos de polling já rodando. Abortando.")
+            # ANTI-SPAM: Verificar se já existe processo de polling (varredura única, fora do event loop)
+            if await self._run_io(self._polling_process_exists):
+                self.logger.warning("🚫 ANTI-SPAM: processo de polling já rodando. Abortando.")
                 return False
             
             # Parar processo anterior se existir
-            if self._polling_process and self._polling_process.poll() is None:
-                self._polling_process.terminate()
-                await asyncio.sleep(2)
-                
-                # Force kill se necessário
-                if self._polling_process.poll() is None:
-                    self._polling_process.kill()
-                    await asyncio.sleep(1)
+            await self._stop_polling_process()
             
             # Caminho para o script de polling
             polling_script = Path(__file__).parent.parent.parent.parent.parent / "telegram-bot-polling.py"
@@ -180,31 +626,28 @@ class TelegramMCPServer(MCPServer):
                 self.logger.error(f"🚫 Polling script not found: {polling_script}")
                 return False
             
-            # ANTI-SPAM: Verificar novamente antes de iniciar
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    cmdline = proc.info['cmdline'] or []
-                    if any('telegram-bot-polling' in str(cmd) for cmd in cmdline):
-                        self.logger.warning("🚫 ANTI-SPAM: Processo detectado durante inicialização. Cancelando.")
-                        return False
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # Iniciar processo de polling
+            # Iniciar processo de polling - saída descartada: pipes nunca lidos
+            # enchem o buffer do SO e travam o processo filho
             self.logger.info("🚀 Iniciando processo único de polling...")
-            self._polling_process = subprocess.Popen([
-                "python", str(polling_script)
-            ], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
+            self._polling_process = await asyncio.create_subprocess_exec(
+                sys.executable, str(polling_script),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
                 cwd=str(polling_script.parent)
             )
             
-            # Dar tempo para o processo iniciar
-            await asyncio.sleep(3)
+            # Janela mínima de partida: um filho que morre ao iniciar (ex.: ImportError)
+            # sai dentro dela. getMe só mede a API do Telegram, não o processo
+            try:
+                await asyncio.wait_for(self._polling_process.wait(), self.POLLING_STARTUP_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
             
             # Verificar se processo iniciou corretamente
-            if self._polling_process.poll() is None:
+            if self._polling_process.returncode is None:
+                # Sinal extra de prontidão: a API do bot responde
+                if self._telegram_service and not await self._run_io(self._telegram_service.get_bot_info):
+                    self.logger.warning("🟡 Polling process running, bot API not responding yet")
                 self._bot_online = True
                 self.logger.info("✅ Bot polling started successfully (single instance)")
                 return True
@@ -216,6 +659,34 @@ class TelegramMCPServer(MCPServer):
             self.logger.error(f"❌ Error starting bot polling: {e}")
             return False
     
+    async def _stop_polling_process(self) -> None:
+        """Terminar o processo de polling, forçando kill se não sair a tempo"""
+        process = self._polling_process
+        if process is None or process.returncode is not None:
+            return
+        
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), self.POLLING_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            # Force kill se necessário
+            process.kill()
+            await process.wait()
+    
+    def _polling_process_exists(self) -> bool:
+        """Procura um processo telegram-bot-polling, parando no primeiro encontrado"""
+        import psutil
+        
+        # Com attrs, process_iter já lê tudo em oneshot e troca AccessDenied por None;
+        # processos que somem durante a varredura são pulados
+        marker = self.POLLING_PROCESS_MARKER
+        for proc in psutil.process_iter(['cmdline']):
+            cmdline = proc.info['cmdline']
+            # One C-level substring search over the joined argv
+            if cmdline and marker in ' '.join(cmdline):
+                return True
+        return False
+    
     def get_bot_status(self) -> Dict[str, Any]:
         """Obter status detalhado do bot"""
         status = {
@@ -223,7 +694,7 @@ class TelegramMCPServer(MCPServer):
             "last_check": self._last_health_check.isoformat() if self._last_health_check else None,
             "auto_start_enabled": self._auto_start_enabled,
             "monitoring": self._should_monitor,
-            "process_running": self._polling_process and self._polling_process.poll() is None
+            "process_running": self._polling_process is not None and self._polling_process.returncode is None
         }
         
         if not self._bot_online:
@@ -231,193 +702,20 @@ class TelegramMCPServer(MCPServer):
             
         return status
     
-    async def list_tools(self) -> List[Tool]:
-        """List available Telegram tools"""
-        return [
-            Tool(
-                name="send-message",
-                description="Send message to Telegram admin chat",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "message": {
-                            "type": "string",
-                            "description": "Message text to send"
-                        },
-                        "format": {
-                            "type": "string", 
-                            "description": "Message format",
-                            "enum": ["text", "markdown", "html"],
-                            "default": "markdown"
-                        },
-                        "reply_markup": {
-                            "type": "object",
-                            "description": "Optional inline keyboard markup"
-                        }
-                    },
-                    "required": ["message"]
-                }
-            ),
-            Tool(
-                name="check-bot-status",
-                description="Check if Telegram bot is online and functioning",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "detailed": {
-                            "type": "boolean", 
-                            "description": "Return detailed status info",
-                            "default": True
-                        },
-                        "restart_if_offline": {
-                            "type": "boolean",
-                            "description": "Attempt to restart bot if offline",
-                            "default": True
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="send-project-report",
-                description="Send comprehensive project analysis report to Telegram",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": "Path to project to analyze"
-                        },
-                        "include_ai": {
-                            "type": "boolean",
-                            "description": "Include AI insights",
-                            "default": True
-                        },
-                        "include_suggestions": {
-                            "type": "boolean",
-                            "description": "Include improvement suggestions",
-                            "default": True
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="send-system-status",
-                description="Send XKit system status to Telegram",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "include_plugins": {
-                            "type": "boolean",
-                            "description": "Include plugin status",
-                            "default": True
-                        },
-                        "include_mcp": {
-                            "type": "boolean", 
-                            "description": "Include MCP server status",
-                            "default": True
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="send-git-status",
-                description="Send Git repository status to Telegram",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "repo_path": {
-                            "type": "string",
-                            "description": "Repository path"
-                        },
-                        "detailed": {
-                            "type": "boolean",
-                            "description": "Include detailed file changes",
-                            "default": False
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="handle-telegram-command",
-                description="Process command received from Telegram bot",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "command": {
-                            "type": "string",
-                            "description": "Command from Telegram chat"
-                        },
-                        "args": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Command arguments"
-                        },
-                        "user_id": {
-                            "type": "string",
-                            "description": "Telegram user ID"
-                        },
-                        "chat_id": {
-                            "type": "string",
-                            "description": "Telegram chat ID"
-                        }
-                    },
-                    "required": ["command"]
-                }
-            ),
-            Tool(
-                name="setup-webhook",
-                description="Setup Telegram webhook for real-time communication",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "webhook_url": {
-                            "type": "string",
-                            "description": "Public webhook URL"
-                        },
-                        "secret_token": {
-                            "type": "string",
-                            "description": "Secret token for webhook validation"
-                        }
-                    },
-                    "required": ["webhook_url"]
-                }
-            ),
-            Tool(
-                name="get-bot-info",
-                description="Get Telegram bot information and status",
-                input_schema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            )
-        ]
+    async def list_tools(self) -> Sequence[Tool]:
+        """List available Telegram tools (the shared, immutable schema tuple)"""
+        return _TOOLS
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a Telegram tool"""
         try:
             # Ensure service is initialized
-            if not self._telegram_service:
-                if not await self.initialize():
+            if self._telegram_service is None:
+                if not await self._ensure_initialized():
                     return {"error": "Telegram service not available"}
             
             # Route to appropriate handler
-            handler_map = {
-                "send-message": self._handle_send_message,
-                "check-bot-status": self._handle_check_bot_status,
-                "send-project-report": self._handle_send_project_report,
-                "send-system-status": self._handle_send_system_status,
-                "send-git-status": self._handle_send_git_status,
-                "handle-telegram-command": self._handle_telegram_command,
-                "setup-webhook": self._handle_setup_webhook,
-                "get-bot-info": self._handle_get_bot_info
-            }
-            
-            handler = handler_map.get(name)
+            handler = self._handlers.get(name)
             if not handler:
                 return {"error": f"Unknown tool: {name}"}
             
@@ -434,9 +732,7 @@ class TelegramMCPServer(MCPServer):
         format_type = args.get("format", "markdown")
         reply_markup = args.get("reply_markup")
         
-        success = await asyncio.get_event_loop().run_in_executor(
-            None, self._telegram_service._send_message, message
-        )
+        success = await self._send_report(message)
         
         return {
             "sent": success,
@@ -482,11 +778,9 @@ class TelegramMCPServer(MCPServer):
             
             # Se solicitado e online, enviar status para o Telegram
             if status["online"]:
-                status_msg = f"🤖 **Bot Status Check** ✅\n\n{response['message']}\n\n⏰ Check: {datetime.now().strftime('%H:%M:%S')}"
+                status_msg = f"🤖 **Bot Status Check** ✅\n\n{response['message']}\n\n⏰ Check: {_now_strs()[0]}"
                 try:
-                    await asyncio.get_event_loop().run_in_executor(
-                        None, self._telegram_service._send_message, status_msg
-                    )
+                    await self._telegram_service._send_message_async(status_msg)
                 except:
                     pass  # Não falhar se envio falhar
             
@@ -528,23 +822,15 @@ class TelegramMCPServer(MCPServer):
         
         try:
             # Get project analyzer plugin through MCP
-            from ...plugins.project_analyzer_plugin import XKitProjectAnalyzerPlugin
-            
-            analyzer = XKitProjectAnalyzerPlugin()
-            await analyzer._initialize_services()
+            analyzer = await self._get_analyzer()
             
-            # Analyze project
-            result = await analyzer.analyze_project(project_path)
-            
-            # Format for Telegram
-            report = await self._format_project_report(
-                result, include_ai, include_suggestions
+            # Analyze and format in one hop off the event loop
+            result, report = await self._run_io(
+                self._analyze_and_format_sync, analyzer, project_path, include_ai, include_suggestions
             )
             
             # Send to Telegram
-            success = await asyncio.get_event_loop().run_in_executor(
-                None, self._telegram_service._send_message, report
-            )
+            success = await self._send_report(report)
             
             return {
                 "sent": success,
@@ -555,9 +841,7 @@ class TelegramMCPServer(MCPServer):
             
         except Exception as e:
             error_msg = f"❌ Erro na análise do projeto: {str(e)}"
-            await asyncio.get_event_loop().run_in_executor(
-                None, self._telegram_service._send_message, error_msg
-            )
+            await self._telegram_service._send_message_async(error_msg)
             return {"sent": False, "error": str(e)}
     
     async def _handle_send_system_status(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -567,9 +851,7 @@ class TelegramMCPServer(MCPServer):
         
         try:
             status_report = await self._format_system_status(include_plugins, include_mcp)
-            success = await asyncio.get_event_loop().run_in_executor(
-                None, self._telegram_service._send_message, status_report
-            )
+            success = await self._send_report(status_report)
             
             return {
                 "sent": success,
@@ -587,9 +869,7 @@ class TelegramMCPServer(MCPServer):
         
         try:
             git_report = await self._format_git_status(repo_path, detailed)
-            success = await asyncio.get_event_loop().run_in_executor(
-                None, self._telegram_service._send_message, git_report
-            )
+            success = await self._send_report(git_report)
             
             return {
                 "sent": success,
@@ -602,7 +882,8 @@ class TelegramMCPServer(MCPServer):
     
     async def _handle_telegram_command(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Process command from Telegram chat"""
-        command = args.get("command", "").lower()
+        # Normalize once: "/Status@SomeBot " -> "/status"
+        command = args.get("command", "").strip().lower().split("@", 1)[0]
         command_args = args.get("args", [])
         user_id = args.get("user_id")
         chat_id = args.get("chat_id")
@@ -612,9 +893,7 @@ class TelegramMCPServer(MCPServer):
         
         # Send response back to Telegram
         if response:
-            await asyncio.get_event_loop().run_in_executor(
-                None, self._telegram_service._send_message, response
-            )
+            await self._send_report(response)
         
         return {
             "command": command,
@@ -638,9 +917,7 @@ class TelegramMCPServer(MCPServer):
     async def _handle_get_bot_info(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get bot information"""
         try:
-            bot_info = await asyncio.get_event_loop().run_in_executor(
-                None, self._telegram_service.get_bot_info
-            )
+            bot_info = await self._run_io(self._telegram_service.get_bot_info)
             return {
                 "bot_info": bot_info,
                 "service_available": self._telegram_service.is_available()
@@ -648,7 +925,16 @@ class TelegramMCPServer(MCPServer):
         except Exception as e:
             return {"error": str(e)}
     
-    async def _format_project_report(self, result, include_ai: bool, include_suggestions: bool) -> str:
+    def _analyze_and_format_sync(self, analyzer, project_path: str, include_ai: bool, include_suggestions: bool):
+        """Analyze the project and format the Telegram report on a worker thread
+        
+        The analyzer's file walk blocks, and its coroutines don't depend on the
+        server loop, so they run to completion on a private loop here.
+        """
+        result = asyncio.run(analyzer.analyze_project(project_path))
+        return result, self._format_project_report(result, include_ai, include_suggestions)
+    
+    def _format_project_report(self, result, include_ai: bool, include_suggestions: bool) -> str:
         """Format project analysis for Telegram"""
         if not result:
             return "❌ Não foi possível analisar o projeto"
@@ -661,38 +947,34 @@ class TelegramMCPServer(MCPServer):
         # Score emoji
         score_emoji = "🟢" if score >= 8 else "🟡" if score >= 6 else "🔴"
         
-        report = [
-            f"📊 **Relatório do Projeto: {project_name}**",
-            f"{score_emoji} **Pontuação: {score}/10**",
-            f"🔧 **Tipo: {project_type}**",
-            "",
+        parts = [
+            f"📊 **Relatório do Projeto: {project_name}**\n"
+            f"{score_emoji} **Pontuação: {score}/10**\n"
+            f"🔧 **Tipo: {project_type}**\n"
+            "\n"
             "📈 **Métricas:**"
         ]
         
         # Add metrics if available
         metrics = getattr(result, 'metrics', None)
         if metrics:
-            report.extend([
-                f"📁 Arquivos: {getattr(metrics, 'total_files', 'N/A')}",
-                f"💻 Código: {getattr(metrics, 'source_files', 'N/A')}",
-                f"📚 Docs: {getattr(metrics, 'documentation_files', 'N/A')}",
-                f"🧪 Testes: {getattr(metrics, 'test_files', 'N/A')}"
-            ])
-        
-        # Add issues
+            parts.append(
+                f"\n📁 Arquivos: {getattr(metrics, 'total_files', 'N/A')}"
+                f"\n💻 Código: {getattr(metrics, 'source_files', 'N/A')}"
+                f"\n📚 Docs: {getattr(metrics, 'documentation_files', 'N/A')}"
+                f"\n🧪 Testes: {getattr(metrics, 'test_files', 'N/A')}"
+            )
+        
+        # Add issues (limit for Telegram)
         issues = getattr(result, 'issues', [])
         if issues:
-            report.extend(["", "⚠️ **Problemas:**"])
-            for issue in issues[:5]:  # Limit for Telegram
-                report.append(f"• {issue}")
+            parts.append("\n\n⚠️ **Problemas:**" + "".join(f"\n• {issue}" for issue in issues[:5]))
         
-        # Add suggestions
+        # Add suggestions (limit for Telegram)
         if include_suggestions:
             suggestions = getattr(result, 'suggestions', [])
             if suggestions:
-                report.extend(["", "💡 **Sugestões:**"])
-                for suggestion in suggestions[:5]:  # Limit for Telegram
-                    report.append(f"• {suggestion}")
+                parts.append("\n\n💡 **Sugestões:**" + "".join(f"\n• {suggestion}" for suggestion in suggestions[:5]))
         
         # Add AI insights
         if include_ai:
@@ -700,135 +982,112 @@ class TelegramMCPServer(MCPServer):
             if ai_insights:
                 # Truncate AI insights for Telegram
                 truncated = ai_insights[:500] + "..." if len(ai_insights) > 500 else ai_insights
-                report.extend([
-                    "",
-                    "🤖 **Insights IA:**",
-                    f"_{truncated}_"
-                ])
-        
-        report.extend([
-            "",
-            f"🕒 **Analisado:** {datetime.now().strftime('%H:%M:%S')}",
-            "🚀 **XKit v3.0**"
-        ])
-        
-        return "\n".join(report)
+                parts.append(f"\n\n🤖 **Insights IA:**\n_{truncated}_")
+        
+        parts.append(
+            f"\n\n🕒 **Analisado:** {_now_strs()[0]}"
+            "\n🚀 **XKit v3.0**"
+        )
+        
+        return "".join(parts)
     
     async def _format_system_status(self, include_plugins: bool, include_mcp: bool) -> str:
         """Format system status for Telegram"""
-        status = [
-            "🚀 **XKit System Status**",
-            f"🕒 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "✅ **Sistema:** Ativo",
-            "🏗️ **Arquitetura:** Hybrid MCP v3.0"
-        ]
-        
-        if include_plugins:
-            status.extend([
-                "",
-                "🧩 **Plugins:**",
-                "• Project Analyzer: ✅ Ativo",
-                "• Telegram Bot: ✅ Ativo",
-                "• MCP Servers: ✅ Funcionando"
-            ])
-        
-        if include_mcp:
-            status.extend([
-                "",
-                "🔌 **MCP Servers:**",
-                "• xkit-core: ✅ Ativo",
-                "• xkit-ai: ✅ Ativo", 
-                "• xkit-git: ✅ Ativo",
-                "• telegram-bot: ✅ Ativo"
-            ])
-        
-        return "\n".join(status)
+        return (
+            "🚀 **XKit System Status**\n"
+            "🕒 " + _now_strs()[1]
+            + _SYSTEM_STATUS_BODY
+            + (_STATIC_PLUGINS_BLOCK if include_plugins else "")
+            + (_STATIC_MCP_BLOCK if include_mcp else "")
+        )
     
     async def _format_git_status(self, repo_path: str, detailed: bool) -> str:
+        """Format Git status for Telegram (cached per unchanged repo directory)"""
+        return await self._cached_report(
+            ("git", detailed), repo_path,
+            lambda: self._build_git_status(repo_path, detailed)
+        )
+    
+    async def _build_git_status(self, repo_path: str, detailed: bool) -> str:
         """Format Git status for Telegram"""
         try:
-            from ...infrastructure.git import GitRepository
-            from pathlib import Path
+            if self._git_repo is None:
+                from ...infrastructure.git import GitRepository
+                self._git_repo = GitRepository()
             
-            git_repo = GitRepository()
             repo_path_obj = Path(repo_path)
-            status_info = git_repo.get_git_info(repo_path_obj)
+            status_info = self._git_repo.get_git_info(repo_path_obj)
             
             if not status_info:
                 return f"❌ Não é um repositório Git: {repo_path}"
             
-            report = [
-                "🌿 **Git Status**",
-                f"📂 **Repo:** {repo_path_obj.name}",
-                f"🌳 **Branch:** {status_info.current_branch}",
-                ""
-            ]
-            
             # Add file changes info
             if status_info.is_clean:
-                report.append("✅ **Repositório limpo**")
+                changes = "✅ **Repositório limpo**"
             else:
-                report.append(f"📝 **Modificações:** {status_info.changes_count} arquivos")
-            
-            return "\n".join(report)
+                changes = f"📝 **Modificações:** {status_info.changes_count} arquivos"
+            
+            return (
+                "🌿 **Git Status**\n"
+                f"📂 **Repo:** {repo_path_obj.name}\n"
+                f"🌳 **Branch:** {status_info.current_branch}\n"
+                "\n"
+                f"{changes}"
+            )
             
         except Exception as e:
             return f"❌ Erro ao obter status Git: {str(e)}"
     
     async def _route_telegram_command(self, command: str, args: list, user_id: str, chat_id: str) -> str:
         """Route Telegram commands to appropriate handlers"""
-        
-        # Basic commands
-        if command in ["/start", "/help"]:
-            return self._get_help_message()
-        
-        elif command == "/status":
-            status = await self._format_system_status(True, True)
-            return status
+        handler = self._commands.get(command)
+        if handler is None:
+            return f"❓ Comando não reconhecido: {command}\\nUse /help para ver comandos disponíveis"
+        return await handler(args, user_id, chat_id)
+    
+    async def _cmd_help(self, args: list, user_id: str, chat_id: str) -> str:
+        return self._get_help_message()
+    
+    async def _cmd_status(self, args: list, user_id: str, chat_id: str) -> str:
+        return await self._format_system_status(True, True)
+    
+    async def _cmd_analyze(self, args: list, user_id: str, chat_id: str) -> str:
+        try:
+            project_path = args[0] if args else "."
+            
+            # Aviso imediato: segue pela rede enquanto a varredura roda
+            notice = None
+            if (self._telegram_service is not None and os.path.isdir(project_path)
+                    and not self._has_fresh_report(("analyze",), project_path)):
+                project_name = os.path.basename(os.path.realpath(project_path))
+                notice = asyncio.create_task(
+                    self._telegram_service._send_message_async(f"⏳ Analisando {project_name}...")
+                )
             
-        elif command == "/analyze":
             try:
-                project_path = args[0] if args else "."
                 # Análise simplificada direta
                 return await self._simple_project_analysis(project_path)
-            except Exception as e:
-                return f"❌ Erro na análise: {str(e)}"
-        
-        elif command == "/git":
-            try:
-                repo_path = args[0] if args else "."
-                return await self._format_git_status(repo_path, True)
-            except Exception as e:
-                return f"❌ Erro no Git: {str(e)}"
-        
-        elif command == "/plugins":
-            return "🧩 **Plugins Disponíveis:**\\n• Project Analyzer\\n• Telegram Bot\\n• MCP Integration"
-        
-        else:
-            return f"❓ Comando não reconhecido: {command}\\nUse /help para ver comandos disponíveis"
+            finally:
+                # O relatório só é enviado depois do aviso, mantendo a ordem no chat
+                if notice is not None:
+                    await asyncio.gather(notice, return_exceptions=True)
+        except Exception as e:
+            return f"❌ Erro na análise: {str(e)}"
+    
+    async def _cmd_git(self, args: list, user_id: str, chat_id: str) -> str:
+        try:
+            repo_path = args[0] if args else "."
+            return await self._format_git_status(repo_path, True)
+        except Exception as e:
+            return f"❌ Erro no Git: {str(e)}"
     
-    def _get_help_message(self) -> str:
+    async def _cmd_plugins(self, args: list, user_id: str, chat_id: str) -> str:
+        return "🧩 **Plugins Disponíveis:**\\n• Project Analyzer\\n• Telegram Bot\\n• MCP Integration"
+    
+    @staticmethod
+    def _get_help_message() -> str:
         """Get help message for Telegram bot"""
-        return """🤖 **XKit Telegram Bot - Comandos Disponíveis**
-
-📊 **Análise de Projetos:**
-/analyze - Analisar projeto atual
-/analyze /path/to/project - Analisar projeto específico
-
-🔧 **Sistema:**
-/status - Status completo do XKit
-/plugins - Listar plugins disponíveis
-
-🌿 **Git:**
-/git - Status do repositório atual
-/git /path/to/repo - Status de repositório específico
-
-❓ **Ajuda:**
-/help - Esta mensagem de ajuda
-
-🚀 **XKit v3.0 - Hybrid MCP Architecture**
-Desenvolvido com ❤️ para desenvolvedores"""
+        return TELEGRAM_HELP_MSG
     
     async def _enhanced_project_analysis(self, project_path: str) -> str:
         """Análise avançada de projeto com Git, configs e formatação Telegram"""
@@ -843,64 +1102,8 @@ Desenvolvido com ❤️ para desenvolvedores"""
                 return f"❌ Caminho não encontrado: {project_path}"
             
             # === ANÁLISE DE ARQUIVOS ===
-            total_files = 0
-            source_files = 0
-            doc_files = 0
-            config_files = 0
-            test_files = 0
-            
-            # Extensões por categoria
-            source_exts = {'.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cs', '.cpp', '.c', '.go', '.rs', '.php', '.rb', '.kt', '.swift'}
-            doc_exts = {'.md', '.txt', '.rst', '.adoc', '.wiki'}
-            config_exts = {'.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.xml', '.env'}
-            test_exts = {'.test.', '.spec.', '_test.', '_spec.'}
-            
-            # Tecnologias e frameworks detectados
-            technologies = set()
-            frameworks = set()
-            config_analysis = []
-            
-            # Percorrer arquivos
-            for root, dirs, files in os.walk(path):
-                # Ignorar diretórios comuns
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in {
-                    'node_modules', '__pycache__', 'target', 'build', 'dist', 'venv', 'env'
-                }]
-                
-                for file in files:
-                    if file.startswith('.') and file not in {'.env', '.gitignore', '.dockerignore'}:
-                        continue
-                        
-                    total_files += 1
-                    file_path = Path(root) / file
-                    ext = file_path.suffix.lower()
-                    
-                    # Classificar arquivo
-                    if any(test in file.lower() for test in test_exts):
-                        test_files += 1
-                    elif ext in source_exts:
-                        source_files += 1
-                        
-                        # Detectar tecnologias por extensão
-                        tech_map = {
-                            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-                            '.jsx': 'React', '.tsx': 'React TypeScript', '.java': 'Java',
-                            '.cs': 'C#', '.cpp': 'C++', '.c': 'C', '.go': 'Go',
-                            '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby', '.kt': 'Kotlin',
-                            '.swift': 'Swift'
-                        }
-                        if ext in tech_map:
-                            technologies.add(tech_map[ext])
-                            
-                    elif ext in doc_exts:
-                        doc_files += 1
-                    elif ext in config_exts or file.lower() in {
-                        'dockerfile', 'makefile', 'rakefile', 'gemfile'
-                    }:
-                        config_files += 1
-                    
-                    # === ANÁLISE ESPECÍFICA DE CONFIGS ===
-                    await self._analyze_config_file(file_path, config_analysis, frameworks)
+            # Varredura síncrona no pool de I/O para não travar o event loop
+            scan = await self._run_io(self._scan_project_sync, path)
             
             # === ANÁLISE GIT AVANÇADA ===
             git_info = await self._analyze_git_status(path)
@@ -910,24 +1113,108 @@ Desenvolvido com ❤️ para desenvolvedores"""
             
             # === CALCULAR SCORE INTELIGENTE ===
             score = await self._calculate_project_score(
-                source_files, doc_files, config_files, test_files, git_info, frameworks
+                scan['source_files'], scan['doc_files'], scan['config_files'],
+                scan['test_files'], git_info, scan['frameworks']
             )
             
             # === FORMATAÇÃO TELEGRAM AVANÇADA ===
             return await self._format_enhanced_report(
-                path, score, total_files, source_files, doc_files, 
-                config_files, test_files, technologies, frameworks, 
-                config_analysis, git_info, github_info
+                path, score, scan['total_files'], scan['source_files'], scan['doc_files'],
+                scan['config_files'], scan['test_files'], scan['technologies'], scan['frameworks'],
+                scan['config_analysis'], git_info, github_info, scan['partial']
             )
             
         except Exception as e:
             return f"❌ Erro na análise avançada: {str(e)}"
     
-    async def _analyze_config_file(self, file_path: Path, config_analysis: list, frameworks: set):
-        """Analisa arquivos de configuração específicos"""
-        try:
-            file_name = file_path.name.lower()
+    def _scan_project_sync(self, path: Path) -> Dict[str, Any]:
+        """Contagem de arquivos, tecnologias e configs (bloqueante - roda fora do event loop)"""
+        total_files = 0
+        source_files = 0
+        doc_files = 0
+        config_files = 0
+        test_files = 0
+        
+        # Tecnologias e frameworks detectados
+        technologies = set()
+        frameworks = set()
+        config_analysis = []
+        
+        # Orçamento de varredura: em árvores enormes a latência fica limitada
+        scanned = 0
+        deadline = time.monotonic() + SCAN_TIME_BUDGET
+        partial = False
+        
+        # Percorrer arquivos - pilha de os.scandir, sem Path por arquivo;
+        # subdiretórios empilhados em ordem reversa mantêm a ordem do os.walk
+        stack = [os.fspath(path)]
+        while stack and not partial:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    scanned += 1
+                    if scanned > SCAN_ENTRY_BUDGET or time.monotonic() > deadline:
+                        partial = True
+                        break
+                    
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        # Ignorar diretórios comuns (links não são seguidos, como no os.walk)
+                        if not name.startswith('.') and name not in _SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    
+                    if name.startswith('.') and name not in _KEPT_DOTFILES:
+                        continue
+                    
+                    total_files += 1
+                    lower_name = name.lower()
+                    dot = name.rfind('.')
+                    ext = lower_name[dot:] if dot > 0 else ''
+                    
+                    # Classificar arquivo
+                    if any(marker in lower_name for marker in _TEST_MARKERS):
+                        test_files += 1
+                    elif ext in _EXT_TO_TECH:
+                        # Código-fonte - a extensão já indica a tecnologia
+                        source_files += 1
+                        if len(technologies) < REPORT_TECH_LIMIT:
+                            technologies.add(_EXT_TO_TECH[ext])
+                    elif ext in _DOC_EXTS:
+                        doc_files += 1
+                    elif ext in _CONFIG_EXTS or lower_name in _CONFIG_NAMES:
+                        config_files += 1
+                    
+                    # === ANÁLISE ESPECÍFICA DE CONFIGS ===
+                    self._analyze_config_file(entry.path, lower_name, config_analysis, frameworks)
             
+            stack.extend(reversed(subdirs))
+        
+        return {
+            'total_files': total_files,
+            'source_files': source_files,
+            'doc_files': doc_files,
+            'config_files': config_files,
+            'test_files': test_files,
+            'technologies': technologies,
+            'frameworks': frameworks,
+            'config_analysis': config_analysis,
+            'partial': partial
+        }
+    
+    def _analyze_config_file(self, file_path: str, file_name: str, config_analysis: list, frameworks: set):
+        """Analisa arquivos de configuração específicos (file_name já em minúsculas)"""
+        try:
             # Package.json (Node.js/JavaScript)
             if file_name == 'package.json':
                 try:
@@ -1203,32 +1490,33 @@ Desenvolvido com ❤️ para desenvolvedores"""
     
     async def _format_enhanced_report(self, path, score, total_files, source_files, doc_files, 
                                     config_files, test_files, technologies, frameworks, 
-                                    config_analysis, git_info, github_info):
+                                    config_analysis, git_info, github_info, partial=False):
         """Formatar relatório avançado para Telegram"""
         
         # Emoji baseado no score
         score_emoji = "🟢" if score >= 8 else "🟡" if score >= 6 else "🔴"
         
-        report = [
-            f"📊 **Análise Avançada: {path.name}**",
-            f"{score_emoji} **Score: {score}/10**",
-            ""
+        # Cada seção é um bloco de linhas pronto; o relatório é a junção delas
+        sections = [
+            f"📊 **Análise Avançada: {path.name}**\n"
+            f"{score_emoji} **Score: {score}/10**\n"
         ]
         
         # === SEÇÃO DE MÉTRICAS ===
-        metrics_code = f"""📈 Métricas do Projeto:
+        sections.append(f"""```
+📈 Métricas do Projeto:
 📁 Total: {total_files} arquivos
 💻 Código: {source_files} arquivos  
 🧪 Testes: {test_files} arquivos
 � Docs: {doc_files} arquivos
-⚙️ Config: {config_files} arquivos"""
+⚙️ Config: {config_files} arquivos
+```
+""")
         
-        report.extend([
-            "```",
-            metrics_code,
-            "```",
-            ""
-        ])
+        if partial:
+            sections.append(
+                f"⚠️ _Análise parcial: varredura limitada a {SCAN_ENTRY_BUDGET} entradas / {SCAN_TIME_BUDGET:.0f}s_\n"
+            )
         
         # === SEÇÃO GIT (FORMATADA) ===
         if git_info['has_git']:
@@ -1246,98 +1534,76 @@ Desenvolvido com ❤️ para desenvolvedores"""
             if git_info['last_commit']:
                 git_status_code += f"\n📌 Último: {git_info['last_commit']}"
             
-            report.extend([
-                "```",
-                git_status_code,
-                "```"
-            ])
+            sections.append(f"```\n{git_status_code}\n```")
             
             # Detalhes de arquivos não commitados
             if git_info['status_details']:
-                report.append("⚠️ **Arquivos pendentes:**")
+                pending = "⚠️ **Arquivos pendentes:**"
                 for status_char, filename in git_info['status_details'][:3]:
                     status_emoji = "📝" if status_char.strip() in ['M', 'A'] else "❓" if status_char.strip() == "??" else "🔄"
-                    report.append(f"`{status_emoji} {filename[:40]}{'...' if len(filename) > 40 else ''}`")
+                    pending += f"\n`{status_emoji} {filename[:40]}{'...' if len(filename) > 40 else ''}`"
                 
                 if len(git_info['status_details']) > 3:
-                    report.append(f"_... e mais {len(git_info['status_details']) - 3} arquivos_")
-                report.append("")
+                    pending += f"\n_... e mais {len(git_info['status_details']) - 3} arquivos_"
+                sections.append(pending + "\n")
         else:
-            report.extend([
-                "❌ **Git não inicializado**",
-                "_Considere: `git init`_",
-                ""
-            ])
+            sections.append("❌ **Git não inicializado**\n_Considere: `git init`_\n")
         
         # === ÚLTIMOS 3 COMMITS ===
         if git_info['has_git'] and git_info['recent_commits']:
-            report.append("📚 **Últimos commits:**")
-            for i, commit in enumerate(git_info['recent_commits'][:3]):
-                emoji = "📌" if i == 0 else "📋"
-                report.append(f"`{emoji} {commit}`")
-            report.append("")
+            commits = "".join(
+                f"\n`{'📌' if i == 0 else '📋'} {commit}`"
+                for i, commit in enumerate(git_info['recent_commits'][:3])
+            )
+            sections.append(f"📚 **Últimos commits:**{commits}\n")
         
         # === SEÇÃO GITHUB ===
         if github_info['is_github_repo']:
-            report.append(f"🐙 **GitHub: {github_info['repo_info']}**")
+            sections.append(f"🐙 **GitHub: {github_info['repo_info']}**")
             
             # Issues abertas
             if github_info['open_issues']:
-                report.append(f"🔥 **Issues abertas ({github_info['issues_count']}):**")
+                issues = f"🔥 **Issues abertas ({github_info['issues_count']}):**"
                 for issue in github_info['open_issues']:
                     labels_str = f" `{', '.join(issue['labels'])}`" if issue['labels'] else ""
-                    report.append(f"• #{issue['number']} {issue['title']}{labels_str}")
+                    issues += f"\n• #{issue['number']} {issue['title']}{labels_str}"
                 
                 if github_info['issues_count'] > len(github_info['open_issues']):
                     remaining = github_info['issues_count'] - len(github_info['open_issues'])
-                    report.append(f"_... e mais {remaining} issues_")
-                report.append("")
+                    issues += f"\n_... e mais {remaining} issues_"
+                sections.append(issues + "\n")
             
             # PRs abertos
             if github_info['open_prs']:
-                report.append(f"🔄 **Pull Requests ({github_info['prs_count']}):**")
-                for pr in github_info['open_prs']:
-                    report.append(f"• #{pr['number']} {pr['title']} `{pr['branch']}`")
-                report.append("")
+                prs = "".join(
+                    f"\n• #{pr['number']} {pr['title']} `{pr['branch']}`"
+                    for pr in github_info['open_prs']
+                )
+                sections.append(f"🔄 **Pull Requests ({github_info['prs_count']}):**{prs}\n")
             
             # Status geral
             if not github_info['open_issues'] and not github_info['open_prs']:
-                report.extend([
-                    "✅ **Nenhuma issue ou PR aberta**",
-                    ""
-                ])
+                sections.append("✅ **Nenhuma issue ou PR aberta**\n")
         elif github_info['has_gh_cli'] and git_info['has_git']:
-            report.extend([
-                "📱 **GitHub CLI disponível**",
-                "_Use `gh repo create` para conectar ao GitHub_",
-                ""
-            ])
+            sections.append("📱 **GitHub CLI disponível**\n_Use `gh repo create` para conectar ao GitHub_\n")
         
         # === TECNOLOGIAS E FRAMEWORKS ===
         if technologies or frameworks:
-            tech_list = list(technologies)[:3]
+            tech_list = list(technologies)[:REPORT_TECH_LIMIT]
             framework_list = list(frameworks)[:3]
             
+            stack = []
             if tech_list:
-                report.append("🛠️ **Tecnologias:**")
-                for tech in tech_list:
-                    report.append(f"• {tech}")
-            
+                stack.append("🛠️ **Tecnologias:**" + "".join(f"\n• {tech}" for tech in tech_list))
             if framework_list:
-                if tech_list:
-                    report.append("")
-                report.append("🚀 **Frameworks:**")
-                for framework in framework_list:
-                    report.append(f"• {framework}")
-            
-            report.append("")
+                stack.append("🚀 **Frameworks:**" + "".join(f"\n• {framework}" for framework in framework_list))
+            sections.append("\n\n".join(stack) + "\n")
         
         # === ANÁLISE DE CONFIGURAÇÕES ===
         if config_analysis:
-            report.append("⚙️ **Configurações detectadas:**")
-            for config in config_analysis[:4]:  # Máximo 4 para não poluir
-                report.append(f"• {config}")
-            report.append("")
+            # Máximo 4 para não poluir
+            configs = "".join(f"\n• {config}" for config in config_analysis[:4])
+            sections.append(f"⚙️ **Configurações detectadas:**{configs}\n")
         
         # === SUGESTÕES INTELIGENTES ===
         suggestions = []
@@ -1360,23 +1626,25 @@ Desenvolvido com ❤️ para desenvolvedores"""
             suggestions.append("⚙️ Adicionar arquivos de configuração")
         
         if suggestions:
-            report.append("💡 **Sugestões:**")
-            for suggestion in suggestions[:4]:  # Máximo 4
-                report.append(f"• {suggestion}")
-            report.append("")
+            # Máximo 4
+            tips = "".join(f"\n• {suggestion}" for suggestion in suggestions[:4])
+            sections.append(f"💡 **Sugestões:**{tips}\n")
         
         # === FOOTER ===
-        report.extend([
-            f"🕒 **Analisado:** {datetime.now().strftime('%H:%M:%S')}",
+        sections.append(
+            f"🕒 **Analisado:** {_now_strs()[0]}\n"
             "🚀 **XKit v3.0 - Análise Avançada**"
-        ])
+        )
         
-        return "\n".join(report)
+        return "\n".join(sections)
     
     # Manter compatibilidade (alias)
     async def _simple_project_analysis(self, project_path: str) -> str:
-        """Alias para análise avançada (compatibilidade)"""
-        return await self._enhanced_project_analysis(project_path)
+        """Alias para análise avançada (compatibilidade), com cache por diretório inalterado"""
+        return await self._cached_report(
+            ("analyze",), project_path,
+            lambda: self._enhanced_project_analysis(project_path)
+        )
     
     async def shutdown(self):
         """Cleanup when server shuts down"""
@@ -1385,19 +1653,18 @@ Desenvolvido com ❤️ para desenvolvedores"""
             self._should_monitor = False
             
             # Parar processo de polling
-            if self._polling_process and self._polling_process.poll() is None:
+            if self._polling_process and self._polling_process.returncode is None:
                 self.logger.info("🛑 Stopping bot polling process...")
-                self._polling_process.terminate()
-                await asyncio.sleep(2)
-                
-                # Force kill se necessário
-                if self._polling_process.poll() is None:
-                    self._polling_process.kill()
+                await self._stop_polling_process()
             
-            # Aguardar thread de monitoramento
-            if self._monitor_thread and self._monitor_thread.is_alive():
-                self._monitor_thread.join(timeout=5)
+            # Encerrar tarefa de monitoramento (pode estar dormindo entre verificações)
+            if self._monitor_task and not self._monitor_task.done():
+                self._monitor_task.cancel()
+                await asyncio.gather(self._monitor_task, return_exceptions=True)
             
+            self._io_pool.shutdown(wait=False)
+            if self._telegram_service:
+                await self._telegram_service.aclose()
             self._bot_online = False
             self.logger.info("✅ Telegram MCP Server shutdown complete")
             
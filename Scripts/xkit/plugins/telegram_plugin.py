@@ -47,6 +47,11 @@ class TelegramPlugin(XKitCorePlugin):
         if self.event_service:
             await self._register_event_handlers()
     
+    async def _cleanup_services(self) -> None:
+        """Fecha a sessão HTTP assíncrona do serviço Telegram"""
+        if self.telegram_service:
+            await self.telegram_service.aclose()
+    
     async def _setup_mcp_client(self) -> None:
         """Inicializa cliente MCP e servidor Telegram"""
         try:
@@ -276,9 +281,8 @@ class TelegramPlugin(XKitCorePlugin):
     async def _send_async_message(self, message: str) -> bool:
         """Envia mensagem de forma assíncrona"""
         if self.telegram_service:
-            # Executa em thread separada para não bloquear
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.telegram_service._send_message, message)
+            # Envio nativo no event loop (sessão aiohttp do serviço, sem thread por mensagem)
+            return await self.telegram_service._send_message_async(message)
         return False
     
     async def _send_startup_message(self) -> None:
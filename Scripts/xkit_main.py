@@ -33,6 +33,7 @@ try:
     from xkit.infrastructure.display import DisplayService
     from xkit.infrastructure.environment import EnvironmentService
     from xkit.infrastructure.config import ConfigService
+    from xkit.infrastructure.event_loop import install_fast_event_loop
     
     HYBRID_MCP_AVAILABLE = True
 except ImportError as e:
@@ -727,6 +728,7 @@ class XKitV3Application:
     
     def run(self, args: List[str]) -> None:
         """Synchronous entry point"""
+        install_fast_event_loop()
         try:
             asyncio.run(self.run_async(args))
         except KeyboardInterrupt:
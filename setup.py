@@ -106,6 +106,14 @@ setup(
         "container": [
             "docker>=6.1.3",
         ],
+        "git": [
+            "pygit2>=1.14.0",
+        ],
+        "fast": [
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+            "winloop>=0.1.0; sys_platform == 'win32'",
+            "orjson>=3.9.0",
+        ],
         "all": [
             "google-generativeai>=0.3.0",
             "openai>=1.3.7", 
@@ -27,6 +27,7 @@ sys.path.insert(0, str(XKIT_ROOT / "Scripts"))
 try:
     from xkit.infrastructure.config import XKitConfigService
     from xkit.mcp.client import XKitMCPClient
+    from xkit.infrastructure.event_loop import install_fast_event_loop
 except ImportError as e:
     print(f"❌ Erro de import: {e}")
     print("🔧 Executando do diretório correto...")
@@ -328,6 +329,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
+        install_fast_event_loop()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\\n🛑 Interrompido")
@@ -0,0 +1,51 @@
+"""
+Testes do FileSystemRepository - varredura de extensões e leitura de arquivos
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Scripts"))
+
+from xkit.infrastructure.filesystem import FileSystemRepository
+
+
+def test_scan_extensions_finds_nested_files(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.PY").write_text("", encoding="utf-8")
+    (tmp_path / "index.js").write_text("", encoding="utf-8")
+    
+    found = FileSystemRepository().scan_extensions(tmp_path, [".py", ".js", ".go"])
+    
+    assert found == {".py", ".js"}
+
+
+def test_scan_extensions_skips_vendored_dirs(tmp_path):
+    for skipped in ("node_modules", ".git", "__pycache__"):
+        (tmp_path / skipped).mkdir()
+        (tmp_path / skipped / "hidden.py").write_text("", encoding="utf-8")
+    
+    assert FileSystemRepository().scan_extensions(tmp_path, [".py"]) == set()
+
+
+def test_scan_extensions_stops_at_max_files(tmp_path):
+    for i in range(5):
+        (tmp_path / f"f{i}.txt").write_text("", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "late.py").write_text("", encoding="utf-8")
+    
+    # Files in the root are seen first; the budget runs out before sub/
+    assert FileSystemRepository().scan_extensions(tmp_path, [".py"], max_files=5) == set()
+
+
+def test_read_file_sees_edits_despite_cache(tmp_path):
+    target = tmp_path / "notes.txt"
+    target.write_text("primeira", encoding="utf-8")
+    repo = FileSystemRepository()
+    
+    assert repo.read_file(target) == "primeira"
+    # Different size (and mtime) - must be a cache miss
+    target.write_text("segunda versao", encoding="utf-8")
+    assert repo.read_file(target) == "segunda versao"
+    
+    target.unlink()
+    assert repo.read_file(target) is None
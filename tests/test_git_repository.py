@@ -0,0 +1,73 @@
+"""
+Testes do GitRepository - status porcelain v2 e leitura direta do HEAD
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Scripts"))
+
+from xkit.infrastructure.git import GitRepository
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=xkit", "-c", "user.email=xkit@example.com", *args],
+        cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def _make_repo(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    _git(path, "init", "-q", "-b", "main")
+    (path / "old name.txt").write_text("conteudo\n", encoding="utf-8")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "inicial")
+    return path
+
+
+def test_read_status_counts_rename_once_and_untracked(tmp_path):
+    repo = _make_repo(tmp_path / "repo")
+    _git(repo, "mv", "old name.txt", "new name.txt")
+    (repo / "novo arquivo.txt").write_text("x\n", encoding="utf-8")
+    
+    # The rename's original path is a separate NUL field and must not count
+    assert GitRepository()._read_status(repo) == ("main", 2)
+
+
+def test_read_status_clean_repo(tmp_path):
+    repo = _make_repo(tmp_path / "repo")
+    
+    assert GitRepository()._read_status(repo) == ("main", 0)
+
+
+def test_read_status_outside_a_repo_is_none(tmp_path):
+    assert GitRepository()._read_status(tmp_path) is None
+
+
+def test_read_head_branch_from_git_dir(tmp_path):
+    repo = _make_repo(tmp_path / "repo")
+    _git(repo, "checkout", "-q", "-b", "feature/x")
+    
+    assert GitRepository().read_head_branch(repo) == "feature/x"
+
+
+def test_read_head_branch_follows_gitdir_pointer(tmp_path):
+    repo = _make_repo(tmp_path / "repo")
+    worktree = tmp_path / "worktree"
+    _git(repo, "worktree", "add", "-q", "-b", "wt-branch", str(worktree))
+    
+    assert (worktree / ".git").is_file()
+    assert GitRepository().read_head_branch(worktree) == "wt-branch"
+
+
+def test_read_head_branch_detached_is_empty(tmp_path):
+    repo = _make_repo(tmp_path / "repo")
+    _git(repo, "checkout", "-q", "--detach")
+    
+    assert GitRepository().read_head_branch(repo) == ""
+    assert GitRepository()._read_status(repo) == ("", 0)
+
+
+def test_read_head_branch_without_git_dir_is_none(tmp_path):
+    assert GitRepository().read_head_branch(tmp_path) is None
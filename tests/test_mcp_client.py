@@ -0,0 +1,72 @@
+"""
+Testes do XKitMCPClient - índice ferramenta -> servidor usado por find_tool
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Scripts"))
+
+from xkit.mcp.client import XKitMCPClient
+from xkit.mcp.protocol import Tool
+
+
+def _client_with_tools(tools_by_server):
+    client = XKitMCPClient()
+    calls = []
+    
+    async def list_all_tools():
+        calls.append(1)
+        return tools_by_server
+    
+    client.list_all_tools = list_all_tools
+    return client, calls
+
+
+def _tool(name):
+    return Tool(name=name, description="", input_schema={"type": "object"})
+
+
+def test_find_tool_reuses_the_index():
+    client, calls = _client_with_tools({"xkit-git": [_tool("git-status")]})
+    
+    async def scenario():
+        first = await client.find_tool("git-status")
+        second = await client.find_tool("git-status")
+        return first, second
+    
+    first, second = asyncio.run(scenario())
+    
+    assert first[0] == second[0] == "xkit-git"
+    assert len(calls) == 1
+
+
+def test_find_tool_first_server_wins_and_unknown_rebuilds():
+    client, calls = _client_with_tools({
+        "a": [_tool("shared")],
+        "b": [_tool("shared")]
+    })
+    
+    async def scenario():
+        found = await client.find_tool("shared")
+        missing = await client.find_tool("nope")
+        return found, missing
+    
+    found, missing = asyncio.run(scenario())
+    
+    assert found[0] == "a"
+    assert missing is None
+    assert len(calls) == 2
+
+
+def test_invalidated_index_is_rebuilt():
+    client, calls = _client_with_tools({"xkit-git": [_tool("git-status")]})
+    
+    async def scenario():
+        await client.find_tool("git-status")
+        client._invalidate_tool_index()
+        await client.find_tool("git-status")
+    
+    asyncio.run(scenario())
+    
+    assert len(calls) == 2
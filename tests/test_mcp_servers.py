@@ -0,0 +1,237 @@
+"""
+Testes dos servidores MCP internos - resultados entregues em processo
+"""
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Scripts"))
+
+from xkit.mcp.servers.ai_server import XKitAIServer
+from xkit.mcp.servers.core_server import XKitCoreServer
+from xkit.mcp.servers.git_server import XKitGitServer
+
+
+def test_system_info_is_a_fresh_plain_dict():
+    server = XKitCoreServer()
+    
+    info = asyncio.run(server.call_tool("system-info", {}))
+    info["components"]["extra"] = "mutated"
+    info["status"] = "mutated"
+    
+    again = asyncio.run(server.call_tool("system-info", {}))
+    assert type(again) is dict and type(again["components"]) is dict
+    assert "extra" not in again["components"] and again["status"] != "mutated"
+    json.dumps(again)
+
+
+def test_list_commands_does_not_share_module_lists():
+    server = XKitCoreServer()
+    
+    listing = asyncio.run(server.call_tool("list-commands", {"category": "all"}))
+    listing["commands"]["git"].append("mutated")
+    category = asyncio.run(server.call_tool("list-commands", {"category": "git"}))
+    category["commands"].append("mutated")
+    
+    again = asyncio.run(server.call_tool("list-commands", {"category": "git"}))
+    assert "mutated" not in again["commands"] and type(again["commands"]) is list
+    listing = asyncio.run(server.call_tool("list-commands", {"category": "all"}))
+    assert "mutated" not in listing["commands"]["git"] and type(listing["commands"]["git"]) is list
+
+
+def test_ai_results_do_not_share_lists():
+    server = XKitAIServer()
+    
+    first = asyncio.run(server.call_tool("suggest-solution", {"problem": "p", "domain": "git"}))
+    first["suggestions"].append("mutated")
+    first["resources"]["extra"] = "mutated"
+    error = asyncio.run(server.call_tool("analyze-error", {"error_message": "boom"}))
+    error["suggestions"].clear()
+    
+    again = asyncio.run(server.call_tool("suggest-solution", {"problem": "p", "domain": "git"}))
+    assert "mutated" not in again["suggestions"] and "extra" not in again["resources"]
+    assert asyncio.run(server.call_tool("analyze-error", {"error_message": "boom"}))["suggestions"]
+    
+    other = asyncio.run(server.call_tool("suggest-solution", {"problem": "q", "domain": "git"}))
+    assert "mutated" not in other["suggestions"]
+
+
+def test_ai_accepts_unhashable_arguments():
+    server = XKitAIServer()
+    
+    result = asyncio.run(server.call_tool("analyze-error", {"error_message": "boom", "context": ["a", "b"]}))
+    
+    assert result["context"] == ["a", "b"]
+
+
+def test_git_status_cache_drops_expired_entries(tmp_path):
+    server = XKitGitServer()
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        server._status_cache[str(tmp_path / name)] = (0.0, None)
+    
+    asyncio.run(server.call_tool("git-status", {"path": str(Path(__file__).parent)}))
+    
+    assert len(server._status_cache) == 1
+
+
+def test_telegram_reload_config_drops_the_service():
+    from xkit.infrastructure.telegram_service import TelegramService
+    from xkit.mcp.servers.telegram_server import TelegramMCPServer
+    
+    server = TelegramMCPServer()
+    server._telegram_config = {"enabled": True, "token": "old", "admin_id": "1"}
+    server._telegram_service = TelegramService("old", "1")
+    
+    asyncio.run(server.reload_config())
+    
+    assert server._telegram_service is None
+    assert server._telegram_config is None
+
+
+def test_git_commit_info_parses_nul_separated_log(tmp_path):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=xkit", "-c", "user.email=xkit@example.com", *args],
+            cwd=tmp_path, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "primeiro\n\ncorpo ignorado")
+    git("commit", "-q", "--allow-empty", "-m", "segundo: ação\tcom tab")
+    
+    server = XKitGitServer()
+    # Force the `git log -z` fallback even where pygit2 is installed
+    server._libgit2_commits = lambda path, count: None
+    result = asyncio.run(server.call_tool("git-commit-info", {"path": str(tmp_path), "count": 5}))
+    
+    assert [c["message"] for c in result["commits"]] == ["segundo: ação\tcom tab", "primeiro"]
+    assert all(len(c["hash"]) == 40 for c in result["commits"])
+    assert result["count"] == 2
+
+
+def test_git_batch_duplicates_do_not_share_lists():
+    server = XKitGitServer()
+    call = {"name": "git-status", "arguments": {"path": str(Path(__file__).parent)}}
+    
+    first, second = asyncio.run(server.call_tools_batch([call, dict(call)]))
+    first["files"].append("mutated")
+    
+    assert "mutated" not in second["files"]
+
+
+class _ReachableBot:
+    """TelegramService falso: getMe sempre responde"""
+    
+    def get_bot_info(self):
+        return {"ok": True}
+
+
+def _telegram_server_spawning(monkeypatch, child_code):
+    from xkit.mcp.servers import telegram_server
+    
+    real_exec = asyncio.create_subprocess_exec
+    
+    async def spawn(*args, **kwargs):
+        return await real_exec(sys.executable, "-c", child_code, **kwargs)
+    
+    monkeypatch.setattr(telegram_server.asyncio, "create_subprocess_exec", spawn)
+    server = telegram_server.TelegramMCPServer()
+    server.POLLING_STARTUP_TIMEOUT = 1.0
+    server._telegram_service = _ReachableBot()
+    server._polling_process_exists = lambda: False
+    return server
+
+
+def test_polling_child_dying_at_startup_is_a_failure(monkeypatch):
+    server = _telegram_server_spawning(monkeypatch, "raise ImportError('x')")
+    
+    # getMe succeeds, but the child exits inside the startup window
+    assert asyncio.run(server._start_bot_polling()) is False
+    assert server._bot_online is False
+
+
+def test_polling_child_alive_after_startup_window(monkeypatch):
+    server = _telegram_server_spawning(monkeypatch, "import time; time.sleep(30)")
+    
+    async def scenario():
+        started = await server._start_bot_polling()
+        await server._stop_polling_process()
+        return started
+    
+    assert asyncio.run(scenario()) is True
+    assert server._bot_online is True
+
+
+def test_git_overview_serializes_libgit2_reads_per_repository():
+    import threading
+    import time
+    
+    server = XKitGitServer()
+    active = []
+    overlaps = []
+    guard = threading.Lock()
+    
+    def fake_read(*args):
+        with guard:
+            active.append(1)
+            overlaps.append(len(active))
+        time.sleep(0.05)
+        with guard:
+            active.pop()
+        return None
+    
+    server._libgit2_status_lines = fake_read
+    server._libgit2_branches = fake_read
+    server._libgit2_commits = fake_read
+    asyncio.run(server.call_tool("git-overview", {"path": str(Path(__file__).parent)}))
+    
+    assert overlaps == [1, 1, 1]
+
+
+def _analyzer_with_fake_gh():
+    from xkit.mcp.servers.project_analyzer_server import XKitProjectAnalyzerServer
+    
+    server = XKitProjectAnalyzerServer()
+    
+    async def fake_run(command, cwd=None, timeout=None):
+        return 1, ""
+    
+    async def fake_fetch(project_path, limit):
+        return {"issues": [{"number": 1}], "pull_requests": [{"number": 2}]}
+    
+    server._run = fake_run
+    server._fetch_github_info = fake_fetch
+    return server
+
+
+def test_github_info_does_not_hand_out_cached_lists(tmp_path):
+    server = _analyzer_with_fake_gh()
+    
+    async def scenario():
+        first = await server._get_github_info(tmp_path)
+        first["issues"].append("mutated")
+        second = await server._get_github_info(tmp_path)
+        second["pull_requests"].clear()
+        return await server._get_github_info(tmp_path)
+    
+    third = asyncio.run(scenario())
+    
+    assert third == {"issues": [{"number": 1}], "pull_requests": [{"number": 2}]}
+
+
+def test_github_caches_are_bounded(tmp_path):
+    server = _analyzer_with_fake_gh()
+    server.REPO_KEY_CACHE_SIZE = 3
+    server._gh_cache[("expired", 5)] = (-1e9, {})
+    
+    async def scenario():
+        for i in range(5):
+            await server._get_github_info(tmp_path / str(i))
+    
+    asyncio.run(scenario())
+    
+    assert len(server._repo_keys) == 3
+    assert ("expired", 5) not in server._gh_cache
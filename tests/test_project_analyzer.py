@@ -0,0 +1,31 @@
+"""
+Testes do ProjectAnalyzer - detecção de tecnologias
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Scripts"))
+
+from xkit.infrastructure.filesystem import FileSystemRepository
+from xkit.infrastructure.project_analyzer import ProjectAnalyzer
+
+
+def _write_package_json(path: Path, dependencies: dict) -> None:
+    (path / "package.json").write_text(json.dumps({"name": "demo", "dependencies": dependencies}), encoding="utf-8")
+
+
+def test_package_json_without_react_is_only_node(tmp_path):
+    _write_package_json(tmp_path, {"lodash": "^4.17.21"})
+    
+    technologies = ProjectAnalyzer(FileSystemRepository()).detect_technologies(tmp_path)
+    
+    assert technologies == ["Node.js"]
+
+
+def test_package_json_with_react_adds_react(tmp_path):
+    _write_package_json(tmp_path, {"react": "^18.2.0"})
+    
+    technologies = ProjectAnalyzer(FileSystemRepository()).detect_technologies(tmp_path)
+    
+    assert technologies == ["Node.js", "React"]
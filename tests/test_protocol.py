@@ -0,0 +1,36 @@
+"""
+Testes do MCPProtocol - serialização de requisições e respostas
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "Scripts"))
+
+from xkit.mcp.protocol import MCPError, MCPProtocol
+
+
+def test_response_with_none_result_keeps_result():
+    protocol = MCPProtocol()
+    
+    payload = json.loads(protocol.serialize_message(protocol.create_response("1")))
+    
+    assert payload == {"id": "1", "result": None}
+
+
+def test_error_response_has_no_result():
+    protocol = MCPProtocol()
+    response = protocol.create_response("1", error=MCPError(code=-32601, message="Unknown tool"))
+    
+    payload = json.loads(protocol.serialize_message(response))
+    
+    assert "result" not in payload and payload["error"]["code"] == -32601
+
+
+def test_request_omits_response_fields():
+    protocol = MCPProtocol()
+    
+    payload = json.loads(protocol.serialize_message(protocol.create_request("tools/list")))
+    
+    assert set(payload) == {"id", "method", "params"}
+    assert protocol.parse_message(json.dumps(payload)).method == "tools/list"